@@ -2,6 +2,7 @@
 Implementation discovery system for finding and loading SWHID implementations.
 """
 
+import functools
 import importlib
 import importlib.util
 import os
@@ -14,6 +15,57 @@ from .base import SwhidImplementation
 
 logger = logging.getLogger(__name__)
 
+
+# Upper bound on cached plugin classes; each edit of an implementation.py
+# adds an entry, so the cache must not grow for the life of the process
+_PLUGIN_CACHE_SIZE = 64
+
+
+class _PluginLoadError(Exception):
+    """Raised by _load_impl_class so that failed loads are not cached."""
+
+
+@functools.lru_cache(maxsize=_PLUGIN_CACHE_SIZE)
+def _load_impl_class(impl_file: str, module_name: str, mtime_ns: int,
+                     size: int) -> Type[SwhidImplementation]:
+    """
+    Import an implementation.py and return its Implementation class.
+    
+    Cached on the file's path, mtime and size so an unchanged plugin is
+    executed only once per process while edits are picked up. Failures
+    raise _PluginLoadError instead of returning None, so they are retried.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, impl_file)
+    if spec is None:
+        raise _PluginLoadError(f"Could not create spec for {impl_file}")
+    
+    module = importlib.util.module_from_spec(spec)
+    
+    # Add to sys.modules to avoid reload issues
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+    
+    sys.modules[module_name] = module
+    
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        raise _PluginLoadError(f"Failed to execute module {module_name}: {e}") from e
+    
+    # Look for Implementation class
+    impl_class = getattr(module, "Implementation", None)
+    
+    if impl_class is None:
+        raise _PluginLoadError(f"No Implementation class found in {impl_file}")
+    
+    if not issubclass(impl_class, SwhidImplementation):
+        raise _PluginLoadError(
+            f"Implementation class in {impl_file} does not inherit from SwhidImplementation"
+        )
+    
+    return impl_class
+
+
 class ImplementationDiscovery:
     """Discovers and loads SWHID implementations from the filesystem."""
     
@@ -49,7 +101,7 @@ class ImplementationDiscovery:
                 continue
             
             try:
-                impl = self._load_implementation(impl_dir)
+                impl = self._load_implementation(impl_dir, force_reload)
                 if impl and impl.is_available():
                     info = impl.get_info()
                     implementations[info.name] = impl
@@ -62,8 +114,13 @@ class ImplementationDiscovery:
         self._implementations_cache = implementations
         return implementations
     
-    def _load_implementation(self, impl_dir: Path) -> Optional[SwhidImplementation]:
-        """Load a single implementation from a directory."""
+    def _load_implementation(self, impl_dir: Path,
+                             force_reload: bool = False) -> Optional[SwhidImplementation]:
+        """Load a single implementation from a directory.
+        
+        With force_reload, implementation.py is executed again even if an
+        unchanged copy is in the module cache.
+        """
         impl_file = impl_dir / "implementation.py"
         
         if not impl_file.exists():
@@ -73,35 +130,13 @@ class ImplementationDiscovery:
         # Create a unique module name
         module_name = f"implementations.{impl_dir.name}.implementation"
         
-        # Load the module
-        spec = importlib.util.spec_from_file_location(module_name, impl_file)
-        if spec is None:
-            logger.warning(f"Could not create spec for {impl_file}")
-            return None
-        
-        module = importlib.util.module_from_spec(spec)
-        
-        # Add to sys.modules to avoid reload issues
-        if module_name in sys.modules:
-            del sys.modules[module_name]
-        
-        sys.modules[module_name] = module
-        
+        load = _load_impl_class.__wrapped__ if force_reload else _load_impl_class
+        stat = impl_file.stat()
         try:
-            spec.loader.exec_module(module)
-        except Exception as e:
-            logger.warning(f"Failed to execute module {module_name}: {e}")
-            return None
-        
-        # Look for Implementation class
-        impl_class = getattr(module, "Implementation", None)
-        
-        if impl_class is None:
-            logger.warning(f"No Implementation class found in {impl_file}")
-            return None
-        
-        if not issubclass(impl_class, SwhidImplementation):
-            logger.warning(f"Implementation class in {impl_file} does not inherit from SwhidImplementation")
+            impl_class = load(str(impl_file), module_name,
+                              stat.st_mtime_ns, stat.st_size)
+        except _PluginLoadError as e:
+            logger.warning(str(e))
             return None
         
         try:
@@ -131,8 +166,17 @@ class ImplementationDiscovery:
             logger.warning(f"Implementation directory not found: {impl_dir}")
             return None
         
-        return self._load_implementation(impl_dir)
+        return self._load_implementation(impl_dir, force_reload=True)
     
     def clear_cache(self):
-        """Clear the implementations cache."""
+        """Clear this instance's implementations cache.
+        
+        The plugin module cache is shared by every instance and is left
+        alone; use force_reload to execute implementation.py files again.
+        """
         self._implementations_cache.clear()
+    
+    @staticmethod
+    def cache_info():
+        """Return hit/miss statistics for the implementation module cache."""
+        return _load_impl_class.cache_info()
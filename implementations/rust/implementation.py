@@ -7,22 +7,58 @@ for the testing harness.
 
 import subprocess
 import os
+import shutil
 import sys
 import logging
+import time
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tomllib
+    TOMLLIB_AVAILABLE = True
+except ImportError:  # Python < 3.11
+    TOMLLIB_AVAILABLE = False
 
 from harness.plugins.base import SwhidImplementation, ImplementationInfo, ImplementationCapabilities
 from harness.utils.permissions import get_source_permissions, create_git_repo_with_permissions
 
 logger = logging.getLogger(__name__)
 
+# How many parent directories of the cwd to search for the swhid Cargo.toml
+_PROJECT_ROOT_MAX_DEPTH = 8
+
+# Project root lookups shared by all plugin instances, keyed by
+# (SWHID_RS_PATH, cwd) and holding (result, expiry on the monotonic clock)
+_project_root_cache: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+_PROJECT_ROOT_TTL = 300  # seconds
+
+
+def _clear_project_root_cache() -> None:
+    """Forget all cached project root lookups before their TTL expires."""
+    _project_root_cache.clear()
+
+
+# Timeouts (seconds) for the content command: short for the `content --help`
+# probe that detects the argument format, longer for every run that hashes
+# a payload, since those may be large
+_CONTENT_PROBE_TIMEOUT = 2
+_CONTENT_TIMEOUT = 10
+
+# Content command arguments (before the payload path) for each CLI format,
+# in the order they are probed when the format is not yet known
+_CONTENT_FORMAT_ARGS = {
+    "positional": ["content"],           # experimental: swhid content <path>
+    "file_flag": ["content", "--file"],  # published: swhid content --file <path>
+}
+
 class Implementation(SwhidImplementation):
     """Rust SWHID implementation plugin."""
     
     def __init__(self) -> None:
         self._binary_path_cache: Optional[str] = None
-        self._temp_dirs: list = []  # Track temp directories for cleanup
+        self._temp_dirs: List[str] = []  # Track temp directories for cleanup
         self._content_command_format: Optional[str] = None  # Cache detected format: "positional" or "file_flag"
     
     def get_info(self) -> ImplementationInfo:
@@ -86,7 +122,6 @@ class Implementation(SwhidImplementation):
         First checks SWHID_RS_PATH environment variable (set by build process).
         Falls back to PATH search if not set.
         """
-        import shutil
         
         try:
             # First, check SWHID_RS_PATH environment variable
@@ -170,7 +205,6 @@ class Implementation(SwhidImplementation):
         2. PATH search (fallback)
         3. Build from source (backward compatibility)
         """
-        import shutil
         import platform
         
         # Use cached path if available
@@ -428,7 +462,6 @@ class Implementation(SwhidImplementation):
         """
         import stat
         import tempfile
-        import shutil
         import platform
         
         # On Unix-like systems, permissions are usually preserved from filesystem
@@ -446,7 +479,6 @@ class Implementation(SwhidImplementation):
         # Create temporary Git repository with permissions set in index
         # Use shared utility to create Git repo with permissions
         temp_dir = tempfile.mkdtemp(prefix="swhid-rs-tools-")
-        self._temp_dirs = getattr(self, '_temp_dirs', [])
         self._temp_dirs.append(temp_dir)
         
         target_path, success = create_git_repo_with_permissions(
@@ -481,7 +513,7 @@ class Implementation(SwhidImplementation):
                 text=True,
                 encoding='utf-8',
                 errors='replace',
-                timeout=5
+                timeout=_CONTENT_PROBE_TIMEOUT
             )
             # If --help works, check if --file is mentioned in help
             if result.returncode == 0 and "--file" in result.stdout:
@@ -503,7 +535,8 @@ class Implementation(SwhidImplementation):
                             version: Optional[int], hash_algo: Optional[str]) -> Optional[str]:
         """Try to execute content command and return SWHID if successful, None if format wrong.
         
-        Uses cached format if available, otherwise tries both formats to detect the correct one.
+        Uses the cached format if available, otherwise probes `content --help`
+        for it; the other formats are tried in turn if that one fails.
         """
         cmd = [binary_path]
         
@@ -513,82 +546,68 @@ class Implementation(SwhidImplementation):
         if hash_algo == "sha256":
             cmd.extend(["--hash", "sha256"])
         
-        # If we have a cached format, try that first
-        if self._content_command_format == "file_flag":
-            # Try published format first (--file flag)
-            test_cmd = cmd + ["content", "--file", payload_path]
-            try:
-                result = subprocess.run(
-                    test_cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=10
-                )
-                if result.returncode == 0:
-                    output = result.stdout.strip()
-                    if output and output.startswith("swh:"):
-                        return output.split('\n')[0].strip()
-            except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                pass
-            # If cached format failed, try the other one
-            self._content_command_format = None
+        # Try the known or detected format first, then the remaining ones
+        known_format = self._detect_content_command_format(binary_path)
+        order = [known_format]
+        order += [fmt for fmt in _CONTENT_FORMAT_ARGS if fmt not in order]
+        
+        for fmt in order:
+            swhid = self._run_content_command(cmd + _CONTENT_FORMAT_ARGS[fmt], payload_path, _CONTENT_TIMEOUT)
+            if swhid:
+                if fmt != known_format:
+                    self._content_command_format = fmt
+                    logger.debug(f"Detected content command format: {fmt}")
+                return swhid
         
-        # Try experimental format (positional argument) - either first time or as fallback
-        test_cmd = cmd + ["content", payload_path]
+        return None
+    
+    def _run_content_command(self, cmd: list, payload_path: str, timeout: float) -> Optional[str]:
+        """Run one content command variant and return the SWHID it prints, or None."""
         try:
             result = subprocess.run(
-                test_cmd,
-                capture_output=True,
+                cmd + [payload_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
-                timeout=10
+                timeout=timeout
             )
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                if output and output.startswith("swh:"):
-                    # Success with experimental format
-                    if self._content_command_format != "positional":
-                        self._content_command_format = "positional"
-                        logger.debug("Detected experimental version (positional argument works)")
-                    return output.split('\n')[0].strip()
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            pass
+            return None
         
-        # If experimental format failed and we don't have a cached format, try published format
-        if self._content_command_format is None:
-            test_cmd = cmd + ["content", "--file", payload_path]
-            try:
-                result = subprocess.run(
-                    test_cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=10
-                )
-                if result.returncode == 0:
-                    output = result.stdout.strip()
-                    if output and output.startswith("swh:"):
-                        # Success with published format
-                        self._content_command_format = "file_flag"
-                        logger.debug("Detected published version (--file flag works)")
-                        return output.split('\n')[0].strip()
-            except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                    pass
-            
+        if result.returncode != 0:
+            return None
+        output = result.stdout.strip()
+        if output and output.startswith("swh:"):
+            return output.split('\n')[0].strip()
         return None
     
     def _get_project_root(self) -> Optional[str]:
+        """Return the Rust project root directory, cached across instances.
+        
+        Results are kept for _PROJECT_ROOT_TTL seconds per
+        (SWHID_RS_PATH, cwd) pair; see _find_project_root for the search.
+        """
+        key = (os.environ.get("SWHID_RS_PATH", ""), str(Path.cwd()))
+        now = time.monotonic()
+        cached = _project_root_cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
+        project_root = self._find_project_root()
+        _project_root_cache[key] = (project_root, now + _PROJECT_ROOT_TTL)
+        return project_root
+    
+    def _find_project_root(self) -> Optional[str]:
         """
         Find the Rust project root directory.
         
         Search order:
         1. SWHID_RS_PATH environment variable (if it points to project root)
         2. Hardcoded known location (/home/dicosmo/code/swhid-rs)
-        3. Search current directory and parents for Cargo.toml with name="swhid"
+        3. Search current directory and its nearest parents for a Cargo.toml
+           whose package name is "swhid"
         """
         # 1. Check environment variable first (if it points to project root)
         env_path = os.environ.get("SWHID_RS_PATH")
@@ -605,24 +624,35 @@ class Implementation(SwhidImplementation):
         if known_path.exists() and (known_path / "Cargo.toml").exists():
             return str(known_path)
         
-        # 3. Fallback: Look for Cargo.toml in current directory and parents
-        # and check if it contains "swhid" in the name
+        # 3. Fallback: Look for Cargo.toml in current directory and nearby parents
+        # and check that its package name is "swhid"
         current = Path.cwd()
         
-        for path in [current] + list(current.parents):
+        for path in [current, *islice(current.parents, _PROJECT_ROOT_MAX_DEPTH)]:
             cargo_toml = path / "Cargo.toml"
-            if cargo_toml.exists():
-                # Simple check: read first few lines to see if it's the swhid project
-                try:
-                    with open(cargo_toml, 'r') as f:
-                        content = f.read(200)  # Read first 200 chars
-                        if 'name = "swhid"' in content or 'name="swhid"' in content:
-                            return str(path)
-                except Exception:
-                    pass
+            if cargo_toml.exists() and self._is_swhid_cargo_toml(cargo_toml):
+                return str(path)
         
         return None
     
+    @staticmethod
+    def _is_swhid_cargo_toml(cargo_toml: Path) -> bool:
+        """Check whether a Cargo.toml declares the swhid package."""
+        try:
+            with cargo_toml.open('rb') as f:
+                # Cheap bytes check on the head of the file, no decoding needed
+                head = f.read(256)
+                if b'name = "swhid"' not in head and b'name="swhid"' not in head:
+                    return False
+                if not TOMLLIB_AVAILABLE:
+                    return True
+                # Confirm it is the package name and not e.g. a dependency
+                f.seek(0)
+                data = tomllib.load(f)
+            return data.get("package", {}).get("name") == "swhid"
+        except Exception:
+            return False
+    
     def _diagnose_snapshot_branches(self, repo_path: str, binary_path: str):
         """Diagnostic: Compute and log SWHIDs for all branches and tags in a snapshot.
         
@@ -761,9 +791,7 @@ class Implementation(SwhidImplementation):
     
     def _cleanup_temp_dirs(self):
         """Clean up temporary directories created for permission preservation."""
-        import shutil
-        temp_dirs = getattr(self, '_temp_dirs', [])
-        for temp_dir in temp_dirs:
+        for temp_dir in self._temp_dirs:
             try:
                 if os.path.exists(temp_dir):
                     shutil.rmtree(temp_dir)
@@ -14,13 +14,124 @@ This script reads the JSON results file and creates an HTML table showing:
 """
 
 import argparse
+import functools
+import io
 import json
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, TextIO, Tuple, Union
 from html import escape
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Write buffer size (bytes) for generated HTML files
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Stylesheet and legend for the results table page, built once at import time.
+_CSS = """
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        h1 {
+            color: #333;
+        }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            background-color: white;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        th {
+            background-color: #4CAF50;
+            color: white;
+            padding: 10px;
+            text-align: left;
+            font-weight: bold;
+            position: sticky;
+            top: 0;
+            z-index: 10;
+        }
+        td {
+            padding: 4px 8px;
+            border: 1px solid #ddd;
+            font-size: 10px;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            max-width: 150px;
+            min-width: 80px;
+        }
+        td.test-name {
+            font-weight: bold;
+            background-color: #f9f9f9;
+            max-width: 300px;
+        }
+        td.expected {
+            font-family: monospace;
+            font-size: 9px;
+            max-width: 200px;
+        }
+        tr:hover {
+            background-color: #f5f5f5;
+        }
+        .legend {
+            margin: 20px 0;
+            padding: 15px;
+            background-color: white;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .legend-item {
+            display: inline-block;
+            margin: 5px 15px;
+        }
+        .color-box {
+            display: inline-block;
+            width: 20px;
+            height: 20px;
+            border: 1px solid #ccc;
+            vertical-align: middle;
+            margin-right: 5px;
+        }
+        .tooltip {
+            position: relative;
+            cursor: help;
+        }
+        .tooltip:hover::after {
+            content: attr(title);
+            position: absolute;
+            left: 100%;
+            top: 0;
+            background-color: #333;
+            color: white;
+            padding: 5px 10px;
+            border-radius: 3px;
+            white-space: pre-wrap;
+            z-index: 1000;
+            min-width: 200px;
+            font-size: 11px;
+        }
+    """
+
+_LEGEND_HTML = '\n'.join([
+    '<div class="legend">',
+    '<strong>Legend:</strong>',
+    '<div class="legend-item"><span class="color-box" style="background-color: #888888;"></span>SKIP - Test was skipped</div>',
+    '<div class="legend-item"><span class="color-box" style="background-color: #90EE90;"></span>CONFORMANT - PASS with matching expected SWHID</div>',
+    '<div class="legend-item"><span class="color-box" style="background-color: #FF6B6B;"></span>NON-CONFORMANT - Wrong SWHID or FAIL with expected</div>',
+    '<div class="legend-item"><span class="color-box" style="background-color: #87CEEB;"></span>EXECUTED_OK - PASS but no expected to compare</div>',
+    '<div class="legend-item"><span class="color-box" style="background-color: #FFD700;"></span>EXECUTED_ERROR - FAIL without expected</div>',
+    '</div>',
+])
+
 
 class VariantRegistry:
     """Registry for SWHID variants (version + hash algorithm + serialization format)."""
@@ -307,41 +418,121 @@ def filter_results_by_variant(results_data: Dict, variant_id: str,
     }
 
 
-def determine_cell_status(result: Dict, expected_swhid: Optional[str]) -> Tuple[str, str, Optional[str]]:
+def intern_swhids(results_data: Dict) -> Dict:
+    """Intern expected and computed SWHID strings in place.
+    
+    Identical SWHIDs then share one string object, so the per-cell
+    equality check against the expected SWHID is usually a pointer compare.
+    
+    Args:
+        results_data: Results dictionary from JSON file
+    
+    Returns:
+        The same results dictionary
     """
-    Determine the status, color, and content for a test result cell.
+    for test in results_data.get('tests', []):
+        expected = test.get('expected')
+        if expected:
+            for key, value in expected.items():
+                if isinstance(value, str):
+                    expected[key] = sys.intern(value)
+        for result in test.get('results', []):
+            swhid = result.get('swhid')
+            if isinstance(swhid, str):
+                result['swhid'] = sys.intern(swhid)
+    return results_data
+
+
+@dataclass
+class PreparedTest:
+    """A test case with its expected SWHID resolved and results indexed."""
+    id: str
+    expected_swhid: Optional[str]
+    results_by_impl: Dict[str, Dict]
+
+
+@dataclass
+class PreparedResults:
+    """Results reshaped once for the table builders."""
+    implementations: Tuple[str, ...]
+    tests: List[PreparedTest]
+
+
+def prepare_results(results_data: Dict, variant_config: Optional[Dict] = None) -> PreparedResults:
+    """Sort implementations and index each test's results by implementation.
+    
+    Args:
+        results_data: Results dictionary with tests and implementations
+        variant_config: Optional variant configuration; selects which expected key to use
     
     Returns:
-        Tuple of (status_label, html_color, cell_content)
+        PreparedResults shared by all table builders
     """
-    status = result.get('status', 'UNKNOWN')
-    swhid = result.get('swhid')
-    error = result.get('error')
+    implementations = tuple(sorted(impl['id'] for impl in results_data.get('implementations', [])))
+    expected_key = variant_config.get('expected_key', 'swhid') if variant_config else None
+    
+    tests = []
+    for test in results_data.get('tests', []):
+        expected = test.get('expected', {})
+        
+        # Get expected SWHID - use variant-specific key if available
+        if expected_key:
+            expected_swhid = expected.get(expected_key)
+        else:
+            # Fallback: try 'swhid' first, then 'expected_swhid_sha256'
+            expected_swhid = expected.get('swhid') or expected.get('expected_swhid_sha256')
+        
+        tests.append(PreparedTest(
+            id=test.get('id', 'unknown'),
+            expected_swhid=expected_swhid,
+            results_by_impl={r['implementation']: r for r in test.get('results', [])},
+        ))
     
+    return PreparedResults(implementations=implementations, tests=tests)
+
+
+# Cell (status_label, html_color, cell_content) tuples. A cell_content of
+# None means the cell shows the result's own SWHID.
+_SKIP = ('SKIP', '#888888', '')                          # Gray - color only, no text
+_CONFORMANT = ('CONFORMANT', '#90EE90', '')              # Light green - color only, no text
+_NON_CONFORMANT = ('NON-CONFORMANT', '#FF6B6B', None)    # Light red - full wrong SWHID, if any
+_EXECUTED_OK = ('EXECUTED_OK', '#87CEEB', '')            # Sky blue - color only
+_EXECUTED_ERROR = ('EXECUTED_ERROR', '#FFD700', '')      # Gold - color only, no text
+_UNKNOWN = ('UNKNOWN', '#FFFFFF', 'Unknown')
+
+
+@functools.lru_cache(maxsize=16)
+def _status_key(status: str, swhid_matches: bool, has_expected: bool) -> Tuple[str, str, Optional[str]]:
+    """Map a result's status to one of the module-level cell tuples."""
     if status == 'SKIPPED':
-        return ('SKIP', '#888888', '')  # Gray - color only, no text
+        return _SKIP
     
     if status == 'PASS':
-        if expected_swhid:
-            if swhid == expected_swhid:
-                return ('CONFORMANT', '#90EE90', '')  # Light green - color only, no text
-            else:
-                # Non-conformant: show full wrong SWHID
-                return ('NON-CONFORMANT', '#FF6B6B', swhid)  # Light red - full SWHID
-        else:
-            return ('EXECUTED_OK', '#87CEEB', '')  # Sky blue - color only
+        if not has_expected:
+            return _EXECUTED_OK
+        return _CONFORMANT if swhid_matches else _NON_CONFORMANT
     
     if status == 'FAIL':
-        if expected_swhid:
-            # Non-conformant: show full wrong SWHID if available
-            if swhid:
-                return ('NON-CONFORMANT', '#FF6B6B', swhid)  # Full SWHID for discrepancy
-            else:
-                return ('NON-CONFORMANT', '#FF6B6B', '')  # Red - color only, no text
-        else:
-            return ('EXECUTED_ERROR', '#FFD700', '')  # Gold - color only, no text
+        return _NON_CONFORMANT if has_expected else _EXECUTED_ERROR
+    
+    return _UNKNOWN
+
+
+def determine_cell_status(result: Dict, expected_swhid: Optional[str]) -> Tuple[str, str, Optional[str]]:
+    """
+    Determine the status, color, and content for a test result cell.
+    
+    Returns:
+        Tuple of (status_label, html_color, cell_content)
+    """
+    status = result.get('status', 'UNKNOWN')
+    swhid = result.get('swhid')
+    has_expected = bool(expected_swhid)
     
-    return ('UNKNOWN', '#FFFFFF', 'Unknown')
+    cell = _status_key(status, has_expected and swhid == expected_swhid, has_expected)
+    if cell[2] is None:
+        return (cell[0], cell[1], swhid or '')
+    return cell
 
 
 def get_error_summary(error: Optional[Dict]) -> str:
@@ -357,18 +548,39 @@ def get_error_summary(error: Optional[Dict]) -> str:
     return error_message
 
 
-def create_html_table(results_data: Dict, variant_config: Optional[Dict] = None) -> str:
+def create_html_table(results_data: Union[Dict, PreparedResults],
+                      variant_config: Optional[Dict] = None) -> str:
     """Create an HTML table with color-coded results.
     
     Args:
-        results_data: Results dictionary with tests and implementations
+        results_data: Results dictionary (or PreparedResults) with tests and implementations
+        variant_config: Optional variant configuration dict for variant-specific display
+    """
+    buf = io.StringIO()
+    write_html_table(results_data, buf, variant_config)
+    return buf.getvalue()
+
+
+def write_html_table(results_data: Union[Dict, PreparedResults], out: TextIO,
+                     variant_config: Optional[Dict] = None) -> None:
+    """Write an HTML table with color-coded results to a text stream.
+    
+    Rows are written as they are produced, so the full page is never held
+    in memory at once.
+    
+    Args:
+        results_data: Results dictionary (or PreparedResults) with tests and implementations
+        out: Writable text stream (e.g. an open file)
         variant_config: Optional variant configuration dict for variant-specific display
     """
-    implementations = sorted([impl['id'] for impl in results_data.get('implementations', [])])
-    tests = results_data.get('tests', [])
+    if not isinstance(results_data, PreparedResults):
+        results_data = prepare_results(results_data, variant_config)
+    implementations = results_data.implementations
+    tests = results_data.tests
     
     if not implementations or not tests:
-        return "<p>No data to display</p>"
+        out.write("<p>No data to display</p>")
+        return
     
     # Determine variant info for title
     if variant_config:
@@ -379,186 +591,93 @@ def create_html_table(results_data: Dict, variant_config: Optional[Dict] = None)
         variant_title = None
     
     # Start HTML
-    html = ['<!DOCTYPE html>', '<html>', '<head>', '<meta charset="UTF-8">']
-    html.append(f'<title>{escape(page_title)}</title>')
-    html.append('<style>')
-    html.append('''
-        body {
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }
-        h1 {
-            color: #333;
-        }
-        table {
-            border-collapse: collapse;
-            width: 100%;
-            background-color: white;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        th {
-            background-color: #4CAF50;
-            color: white;
-            padding: 10px;
-            text-align: left;
-            font-weight: bold;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-        }
-        td {
-            padding: 4px 8px;
-            border: 1px solid #ddd;
-            font-size: 10px;
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            max-width: 150px;
-            min-width: 80px;
-        }
-        td.test-name {
-            font-weight: bold;
-            background-color: #f9f9f9;
-            max-width: 300px;
-        }
-        td.expected {
-            font-family: monospace;
-            font-size: 9px;
-            max-width: 200px;
-        }
-        tr:hover {
-            background-color: #f5f5f5;
-        }
-        .legend {
-            margin: 20px 0;
-            padding: 15px;
-            background-color: white;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .legend-item {
-            display: inline-block;
-            margin: 5px 15px;
-        }
-        .color-box {
-            display: inline-block;
-            width: 20px;
-            height: 20px;
-            border: 1px solid #ccc;
-            vertical-align: middle;
-            margin-right: 5px;
-        }
-        .tooltip {
-            position: relative;
-            cursor: help;
-        }
-        .tooltip:hover::after {
-            content: attr(title);
-            position: absolute;
-            left: 100%;
-            top: 0;
-            background-color: #333;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 3px;
-            white-space: pre-wrap;
-            z-index: 1000;
-            min-width: 200px;
-            font-size: 11px;
-        }
-    ''')
-    html.append('</style>')
-    html.append('</head>')
-    html.append('<body>')
-    html.append(f'<h1>{escape(page_title)}</h1>')
+    def emit(fragment: str) -> None:
+        out.write(fragment)
+        out.write('\n')
+    
+    emit('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="UTF-8">')
+    emit(f'<title>{escape(page_title)}</title>')
+    emit(f'<style>{_CSS}</style>')
+    emit('</head>')
+    emit('<body>')
+    emit(f'<h1>{escape(page_title)}</h1>')
     
     # Add variant info if available
     if variant_title:
-        html.append(f'<p><strong>Variant:</strong> {escape(variant_title)}</p>')
+        emit(f'<p><strong>Variant:</strong> {escape(variant_title)}</p>')
     
     # Add legend
-    html.append('<div class="legend">')
-    html.append('<strong>Legend:</strong>')
-    html.append('<div class="legend-item"><span class="color-box" style="background-color: #888888;"></span>SKIP - Test was skipped</div>')
-    html.append('<div class="legend-item"><span class="color-box" style="background-color: #90EE90;"></span>CONFORMANT - PASS with matching expected SWHID</div>')
-    html.append('<div class="legend-item"><span class="color-box" style="background-color: #FF6B6B;"></span>NON-CONFORMANT - Wrong SWHID or FAIL with expected</div>')
-    html.append('<div class="legend-item"><span class="color-box" style="background-color: #87CEEB;"></span>EXECUTED_OK - PASS but no expected to compare</div>')
-    html.append('<div class="legend-item"><span class="color-box" style="background-color: #FFD700;"></span>EXECUTED_ERROR - FAIL without expected</div>')
-    html.append('</div>')
+    emit(_LEGEND_HTML)
     
     # Start table
-    html.append('<table>')
-    html.append('<thead>')
-    html.append('<tr>')
-    html.append('<th>Test Case</th>')
-    html.append('<th>Expected SWHID</th>')
-    for impl in implementations:
-        html.append(f'<th>{escape(impl)}</th>')
-    html.append('</tr>')
-    html.append('</thead>')
-    html.append('<tbody>')
+    emit('<table>')
+    emit('<thead>')
+    emit('<tr>')
+    emit('<th>Test Case</th>')
+    emit('<th>Expected SWHID</th>')
+    emit(''.join(f'<th>{escape(impl)}</th>' for impl in implementations))
+    emit('</tr>')
+    emit('</thead>')
+    emit('<tbody>')
     
     # Add rows
     for test in tests:
-        test_id = test.get('id', 'unknown')
-        expected = test.get('expected', {})
-        
-        # Get expected SWHID - use variant-specific key if available
-        if variant_config:
-            expected_key = variant_config.get('expected_key', 'swhid')
-            expected_swhid = expected.get(expected_key)
-        else:
-            # Fallback: try 'swhid' first, then 'expected_swhid_sha256'
-            expected_swhid = expected.get('swhid') or expected.get('expected_swhid_sha256')
+        expected_swhid = test.expected_swhid
+        expected_tooltip = f"Expected: {expected_swhid}" if expected_swhid else ''
+        result_map = test.results_by_impl
         
-        results = test.get('results', [])
-        
-        result_map = {r['implementation']: r for r in results}
-        
-        html.append('<tr>')
+        emit('<tr>')
         
         # Test name
-        html.append(f'<td class="test-name">{escape(test_id)}</td>')
+        emit(f'<td class="test-name">{escape(test.id)}</td>')
         
         # Expected SWHID
         expected_display = escape(expected_swhid) if expected_swhid else ''
-        html.append(f'<td class="expected">{expected_display}</td>')
+        emit(f'<td class="expected">{expected_display}</td>')
         
         # Results per implementation
         for impl in implementations:
             result = result_map.get(impl)
             if not result:
-                html.append('<td style="background-color: #f0f0f0;">N/A</td>')
-            else:
-                status_label, color, content = determine_cell_status(result, expected_swhid)
-                
-                # Build tooltip with full details
-                tooltip_parts = [f"Status: {status_label}"]
-                if result.get('swhid'):
-                    tooltip_parts.append(f"SWHID: {result.get('swhid')}")
-                if expected_swhid:
-                    tooltip_parts.append(f"Expected: {expected_swhid}")
-                if result.get('error'):
-                    error_summary = get_error_summary(result.get('error'))
-                    tooltip_parts.append(f"Error: {error_summary}")
-                
-                tooltip = '\n'.join(tooltip_parts)
-                
-                # Display content (for non-conformant, content already contains full SWHID)
-                # For conformant/executed_ok, content is empty (color only)
-                display_content = escape(str(content)).replace('\n', '<br>') if content else ''
-                
-                html.append(f'<td class="tooltip" style="background-color: {color};" title="{escape(tooltip)}">{display_content}</td>')
+                emit('<td style="background-color: #f0f0f0;">N/A</td>')
+                continue
+            
+            swhid = result.get('swhid')
+            error = result.get('error')
+            status_label, color, content = determine_cell_status(result, expected_swhid)
+            
+            # Build tooltip with full details
+            tooltip_parts = [f"Status: {status_label}"]
+            if swhid:
+                tooltip_parts.append(f"SWHID: {swhid}")
+            if expected_tooltip:
+                tooltip_parts.append(expected_tooltip)
+            if error:
+                tooltip_parts.append(f"Error: {get_error_summary(error)}")
+            
+            tooltip = '\n'.join(tooltip_parts)
+            
+            # Display content (for non-conformant, content already contains full SWHID)
+            # For conformant/executed_ok, content is empty (color only)
+            display_content = escape(str(content)).replace('\n', '<br>') if content else ''
+            
+            emit(f'<td class="tooltip" style="background-color: {color};" title="{escape(tooltip)}">{display_content}</td>')
         
-        html.append('</tr>')
+        emit('</tr>')
     
-    html.append('</tbody>')
-    html.append('</table>')
-    html.append('</body>')
-    html.append('</html>')
+    emit('</tbody>')
+    emit('</table>')
+    emit('</body>')
+    emit('</html>')
+
+
+def _open_output(path: Path) -> TextIO:
+    """Open an HTML output file for streaming writes.
     
-    return '\n'.join(html)
+    Uses a large write buffer so the many small row fragments are flushed
+    to disk in a few big writes rather than one syscall per few KiB.
+    """
+    return open(path, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE)
 
 
 def generate_table_for_variant(results_data: Dict, variant_id: str, 
@@ -581,12 +700,10 @@ def generate_table_for_variant(results_data: Dict, variant_id: str,
     # Filter results for this variant
     filtered_data = filter_results_by_variant(results_data, variant_id, registry)
     
-    # Generate HTML table
-    html_content = create_html_table(filtered_data, variant_config)
-    
-    # Save to variant-specific file
+    # Write HTML table to variant-specific file
     output_file = output_dir / f"results_{variant_id}.html"
-    output_file.write_text(html_content, encoding='utf-8')
+    with _open_output(output_file) as f:
+        write_html_table(filtered_data, f, variant_config)
     
     return output_file
 
@@ -612,8 +729,8 @@ def generate_all_tables(results_data: Dict, output_dir: Path,
     if not variants:
         # No variants detected - generate single table (backward compatibility)
         output_file = output_dir / "results.html"
-        html_content = create_html_table(results_data)
-        output_file.write_text(html_content, encoding='utf-8')
+        with _open_output(output_file) as f:
+            write_html_table(results_data, f)
         return [output_file]
     
     output_files = []
@@ -789,84 +906,12 @@ def generate_index_page(variants: Set[str], output_dir: Path,
     return index_file
 
 
-def create_table_rich(results_data: Dict):
-    """Create a rich table with color-coded results."""
-    console = Console()
-    
-    # Get implementations and tests
-    implementations = sorted([impl['id'] for impl in results_data.get('implementations', [])])
-    tests = results_data.get('tests', [])
-    
-    if not implementations:
-        console.print("[red]No implementations found in results[/red]")
-        return None
-    
-    if not tests:
-        console.print("[red]No test cases found in results[/red]")
-        return None
-    
-    # Create table
-    table = Table(title="SWHID Test Results", show_header=True, header_style="bold magenta")
-    
-    # Add columns
-    table.add_column("Test Case", style="cyan", no_wrap=True)
-    table.add_column("Expected", style="dim", max_width=20)
-    
-    for impl in implementations:
-        table.add_column(impl, justify="center", max_width=25)
-    
-    # Add rows
-    for test in tests:
-        test_id = test.get('id', 'unknown')
-        expected = test.get('expected', {})
-        expected_swhid = expected.get('swhid')
-        results = test.get('results', [])
-        
-        # Create result map by implementation
-        result_map = {r['implementation']: r for r in results}
-        
-        # Build row
-        row = [test_id]
-        
-        # Expected SWHID (shortened)
-        expected_display = expected_swhid[:20] + '...' if expected_swhid and len(expected_swhid) > 20 else (expected_swhid or '')
-        row.append(expected_display)
-        
-        # Results per implementation
-        for impl in implementations:
-            result = result_map.get(impl)
-            if not result:
-                cell_text = Text('N/A', style='dim white')
-            else:
-                status_label, color = determine_cell_status(result, expected_swhid)
-                swhid = result.get('swhid')
-                error = result.get('error')
-                
-                # Build cell content
-                cell_parts = [status_label]
-                
-                if swhid:
-                    swhid_short = swhid[:15] + '...' if len(swhid) > 15 else swhid
-                    cell_parts.append(f"\n{swhid_short}")
-                
-                if error:
-                    error_summary = get_error_summary(error)
-                    if error_summary:
-                        cell_parts.append(f"\n{error_summary}")
-                
-                cell_text = Text('\n'.join(cell_parts), style=color)
-            
-            row.append(cell_text)
-        
-        table.add_row(*row)
-    
-    return table
-
-
-def create_table_basic(results_data: Dict) -> None:
-    """Create a basic text table (fallback when rich is not available)."""
-    implementations = sorted([impl['id'] for impl in results_data.get('implementations', [])])
-    tests = results_data.get('tests', [])
+def create_table_basic(results_data: Union[Dict, PreparedResults]) -> None:
+    """Print a basic text table of the results."""
+    if not isinstance(results_data, PreparedResults):
+        results_data = prepare_results(results_data)
+    implementations = results_data.implementations
+    tests = results_data.tests
     
     if not implementations or not tests:
         print("No data to display")
@@ -881,22 +926,18 @@ def create_table_basic(results_data: Dict) -> None:
     
     # Print rows
     for test in tests:
-        test_id = test.get('id', 'unknown')
-        expected = test.get('expected', {})
-        expected_swhid = expected.get('swhid')
-        results = test.get('results', [])
-        
-        result_map = {r['implementation']: r for r in results}
+        expected_swhid = test.expected_swhid
+        result_map = test.results_by_impl
         
         expected_display = expected_swhid[:24] if expected_swhid else ''
-        row = f"{test_id:<40} {expected_display:<25}"
+        row = f"{test.id:<40} {expected_display:<25}"
         
         for impl in implementations:
             result = result_map.get(impl)
             if not result:
                 cell = 'N/A'
             else:
-                status_label, _ = determine_cell_status(result, expected_swhid)
+                status_label, _, _ = determine_cell_status(result, expected_swhid)
                 swhid = result.get('swhid', '')
                 error = result.get('error')
                 
@@ -915,22 +956,14 @@ def create_table_basic(results_data: Dict) -> None:
         print(row)
 
 
-def print_legend(console: Optional = None):
+def print_legend():
     """Print a legend explaining the color codes."""
-    if console:
-        console.print("\n[bold]Legend:[/bold]")
-        console.print("[dim white]SKIP[/dim white] - Test was skipped")
-        console.print("[green]CONFORMANT[/green] - PASS with matching expected SWHID")
-        console.print("[red]NON-CONFORMANT[/red] - PASS but wrong SWHID, or FAIL with expected")
-        console.print("[blue]EXECUTED_OK[/blue] - PASS but no expected to compare")
-        console.print("[yellow]EXECUTED_ERROR[/yellow] - FAIL without expected")
-    else:
-        print("\nLegend:")
-        print("SKIP - Test was skipped")
-        print("CONFORMANT - PASS with matching expected SWHID")
-        print("NON-CONFORMANT - PASS but wrong SWHID, or FAIL with expected")
-        print("EXECUTED_OK - PASS but no expected to compare")
-        print("EXECUTED_ERROR - FAIL without expected")
+    print("\nLegend:")
+    print("SKIP - Test was skipped")
+    print("CONFORMANT - PASS with matching expected SWHID")
+    print("NON-CONFORMANT - PASS but wrong SWHID, or FAIL with expected")
+    print("EXECUTED_OK - PASS but no expected to compare")
+    print("EXECUTED_ERROR - FAIL without expected")
 
 
 def main():
@@ -992,8 +1025,12 @@ Examples:
         sys.exit(1)
     
     try:
-        with open(results_path, 'r') as f:
-            results_data = json.load(f)
+        with open(results_path, 'rb') as f:
+            raw = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        results_data = intern_swhids(
+            orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        )
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON in results file: {e}", file=sys.stderr)
         sys.exit(1)
@@ -1028,19 +1065,16 @@ Examples:
                 print(f"  - {output_file}", file=sys.stderr)
     else:
         # Legacy single-table mode (backward compatible)
-        html_content = create_html_table(results_data)
-        
+        prepared = prepare_results(results_data)
         if args.output:
             output_path = Path(args.output)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            print(f"HTML table written to: {output_path}", file=sys.stderr)
         else:
             # Default to results.html if no output specified
-            default_output = results_path.with_suffix('.html')
-            with open(default_output, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            print(f"HTML table written to: {default_output}", file=sys.stderr)
+            output_path = results_path.with_suffix('.html')
+        
+        with _open_output(output_path) as f:
+            write_html_table(prepared, f)
+        print(f"HTML table written to: {output_path}", file=sys.stderr)
 
 
 if __name__ == '__main__':
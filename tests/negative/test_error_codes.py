@@ -8,120 +8,43 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
-from harness.plugins.base import ErrorCode
+from harness.plugins.base import ErrorCode, ErrorContext
 from harness.harness import SwhidHarness
+from harness.models import ErrorInfo
 
+_EXPECTED_ERROR_CODES = frozenset({
+    "PARSE_ERROR",
+    "NORMALIZE_ERROR",
+    "VALIDATION_ERROR",
+    "COMPUTE_ERROR",
+    "MISMATCH_ERROR",
+    "TIMEOUT",
+    "RESOURCE_LIMIT",
+    "IO_ERROR",
+})
 
 class TestErrorCodeCoverage:
     """Test that all ErrorCode types can be triggered and reported."""
     
-    def test_parse_error(self):
-        """
-        Test PARSE_ERROR: Invalid SWHID format.
-        
-        This should be triggered when an implementation returns an invalid SWHID format.
-        """
-        # This would require an implementation that returns malformed SWHID
-        # For now, we document the expected behavior
-        # PARSE_ERROR should occur when:
-        # - Invalid scheme (not "swh")
-        # - Invalid version (not "1")
-        # - Invalid object type
-        # - Invalid hash format
-        # - Invalid qualifier syntax
-        pass  # Test structure - actual implementation would need malformed SWHID generator
-    
-    def test_normalize_error(self):
-        """
-        Test NORMALIZE_ERROR: Valid parse but canonicalization fails.
-        
-        This occurs when SWHID is syntactically valid but cannot be normalized.
-        """
-        # NORMALIZE_ERROR should occur when:
-        # - Valid syntax but invalid hash length
-        # - Valid syntax but invalid qualifier values
-        # - Case sensitivity issues in normalization
-        pass  # Test structure
-    
-    def test_validation_error(self):
-        """
-        Test VALIDATION_ERROR: Semantically invalid but well-formed.
-        
-        This occurs when SWHID is well-formed but semantically incorrect.
-        """
-        # VALIDATION_ERROR should occur when:
-        # - Hash doesn't match content
-        # - Qualifiers conflict
-        # - Object type mismatch
-        pass  # Test structure
-    
-    def test_compute_error(self, tmp_path):
-        """
-        Test COMPUTE_ERROR: Failure computing SWHID from payload.
-        
-        This is the most common error - implementation fails to compute SWHID.
-        """
-        # Create a payload that should cause computation failure
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-        
-        # Use a mock implementation that raises an exception
-        from tests.unit.test_harness import MockImplementation
-        
-        # This test verifies COMPUTE_ERROR is properly reported
-        # Actual test would use real implementation with known failure case
-        pass  # Test structure
-    
-    def test_mismatch_error(self):
-        """
-        Test MISMATCH_ERROR: Value differs from reference implementation.
-        
-        This occurs when implementations produce different SWHIDs for same input.
-        """
-        # MISMATCH_ERROR is already tested in integration tests
-        # This test documents the error code path
-        pass  # Test structure
-    
-    def test_timeout_error(self):
-        """
-        Test TIMEOUT: Exceeded wall clock budget.
-        
-        This should be triggered by SubprocessAdapter when timeout is exceeded.
-        """
-        # TIMEOUT should occur when:
-        # - Implementation takes too long
-        # - SubprocessAdapter timeout is exceeded
-        # This is tested via SubprocessAdapter with short timeout
-        pass  # Test structure
-    
-    def test_resource_limit_error(self):
-        """
-        Test RESOURCE_LIMIT: Memory/CPU cap exceeded.
-        
-        This should be triggered by SubprocessAdapter when resource limits are exceeded.
-        """
-        # RESOURCE_LIMIT should occur when:
-        # - RSS limit exceeded
-        # - CPU time limit exceeded
-        # This is tested via SubprocessAdapter with low limits
-        pass  # Test structure
-    
-    def test_io_error(self, tmp_path):
-        """
-        Test IO_ERROR: Plugin crashed / bad exit / protocol violation.
-        
-        This occurs when there's a communication or I/O failure.
-        """
-        # IO_ERROR should occur when:
-        # - File not found
-        # - Permission denied
-        # - Protocol violation (invalid JSON)
-        # - Process crash
-        test_file = tmp_path / "nonexistent.txt"
-        
-        # This would trigger IO_ERROR if implementation tries to read non-existent file
-        # Actual test would use real implementation
-        pass  # Test structure
+    # When each code should be raised:
+    # - PARSE_ERROR: invalid SWHID format (scheme, version, object type,
+    #   hash format or qualifier syntax)
+    # - NORMALIZE_ERROR: valid parse but canonicalization fails (hash length,
+    #   qualifier values, case sensitivity)
+    # - VALIDATION_ERROR: well-formed but semantically invalid (hash doesn't
+    #   match content, conflicting qualifiers, object type mismatch)
+    # - COMPUTE_ERROR: implementation fails to compute SWHID from payload
+    # - MISMATCH_ERROR: value differs from reference implementation (already
+    #   covered by the integration tests)
+    # - TIMEOUT: SubprocessAdapter wall clock budget exceeded
+    # - RESOURCE_LIMIT: SubprocessAdapter RSS or CPU time limit exceeded
+    # - IO_ERROR: file not found, permission denied, protocol violation
+    #   (invalid JSON) or process crash
+    @pytest.mark.parametrize("code", sorted(_EXPECTED_ERROR_CODES))
+    @pytest.mark.xfail(reason="error-code triggering not wired up", strict=False, run=False)
+    def test_error_code_triggerable(self, code):
+        """Trigger each ErrorCode through an implementation and check it is reported."""
+        pytest.skip(f"{code} trigger test not implemented")
 
 
 class TestErrorCodeInResults:
@@ -138,8 +61,6 @@ class TestErrorCodeInResults:
         - context: Additional context dict
         """
         # This test verifies the schema includes ErrorCode
-        from harness.models import ErrorInfo
-        
         error = ErrorInfo(
             code="COMPUTE_ERROR",
             subtype="exception",
@@ -153,22 +74,11 @@ class TestErrorCodeInResults:
     
     def test_all_error_codes_defined(self):
         """Verify all ErrorCode enum values are valid."""
-        from harness.plugins.base import ErrorCode
+        missing = _EXPECTED_ERROR_CODES - {c.name for c in ErrorCode}
+        assert not missing, f"Missing codes: {sorted(missing)}"
         
-        expected_codes = [
-            "PARSE_ERROR",
-            "NORMALIZE_ERROR",
-            "VALIDATION_ERROR",
-            "COMPUTE_ERROR",
-            "MISMATCH_ERROR",
-            "TIMEOUT",
-            "RESOURCE_LIMIT",
-            "IO_ERROR"
-        ]
-        
-        for code in expected_codes:
-            assert hasattr(ErrorCode, code), f"ErrorCode.{code} not defined"
-            assert ErrorCode[code].value == code
+        mismatched = {c for c in _EXPECTED_ERROR_CODES if ErrorCode[c].value != c}
+        assert not mismatched, f"Codes whose value differs from their name: {sorted(mismatched)}"
 
 
 class TestErrorContext:
@@ -176,8 +86,6 @@ class TestErrorContext:
     
     def test_error_context_structure(self):
         """Verify error context includes useful debugging information."""
-        from harness.plugins.base import ErrorContext
-        
         context = ErrorContext(
             code=ErrorCode.COMPUTE_ERROR,
             subtype="exception",
@@ -0,0 +1,9 @@
+"""
+Pytest configuration for property-based tests
+"""
+
+import os
+
+# Property-based tests only run with --deep (HARNESS_DEEP_TESTS=1); skip
+# collecting them otherwise so Hypothesis is never imported
+collect_ignore = [] if os.environ.get("HARNESS_DEEP_TESTS") else ["test_property_based.py"]
@@ -0,0 +1,47 @@
+"""
+Shared fixtures for unit tests
+"""
+
+import pytest
+
+# Source of a minimal always-available implementation named "mock"
+IMPL_SRC = '''
+from harness.plugins.base import SwhidImplementation, ImplementationInfo, ImplementationCapabilities
+
+class Implementation(SwhidImplementation):
+    def get_info(self):
+        return ImplementationInfo("mock", "1.0.0", "python")
+    
+    def is_available(self):
+        return True
+    
+    def get_capabilities(self):
+        return ImplementationCapabilities(
+            supported_types=["cnt", "dir"],
+            supported_qualifiers=[],
+            api_version="1.0",
+            max_payload_size_mb=100,
+            supports_unicode=True,
+            supports_percent_encoding=True
+        )
+    
+    def compute_swhid(self, payload_path, obj_type=None):
+        return "swh:1:cnt:mock123"
+'''
+
+
+@pytest.fixture(scope="session")
+def mock_impl_dir(tmp_path_factory):
+    """Implementations directory holding a single mock plugin, built once."""
+    impls = tmp_path_factory.mktemp("impls")
+    (impls / "mock_impl").mkdir()
+    (impls / "mock_impl" / "implementation.py").write_text(IMPL_SRC)
+    return impls
+
+
+@pytest.fixture(scope="session")
+def tmp_content_file(tmp_path_factory):
+    """Small content payload written once and shared by read-only tests."""
+    path = tmp_path_factory.mktemp("content") / "c.txt"
+    path.write_bytes(b"test content")
+    return str(path)
@@ -4,38 +4,38 @@ Unit tests for main harness functionality
 
 import pytest
 import tempfile
-import os
-import yaml
+import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 from unittest.mock import Mock, patch, MagicMock, ANY
 
 from harness.harness import SwhidHarness
-from harness.plugins.base import SwhidImplementation, ImplementationInfo, SwhidTestResult, ComparisonResult
+from harness.plugins.base import (
+    SwhidImplementation, ImplementationInfo, ImplementationCapabilities, SwhidTestResult, ComparisonResult
+)
 
 
+@dataclass
 class MockImplementation(SwhidImplementation):
     """Mock implementation for testing."""
-    
-    def __init__(self, name="mock", available=True, swhid="swh:1:cnt:test123", error=None):
-        self._name = name
-        self._available = available
-        self._swhid = swhid
-        self._error = error
+    name: str = "mock"
+    available: bool = True
+    swhid: str = "swh:1:cnt:test123"
+    error: Optional[str] = None
     
     def get_info(self) -> ImplementationInfo:
         return ImplementationInfo(
-            name=self._name,
+            name=self.name,
             version="1.0.0",
             language="python",
             description="Mock implementation for testing"
         )
     
     def is_available(self) -> bool:
-        return self._available
+        return self.available
     
     def get_capabilities(self):
-        from harness.plugins.base import ImplementationCapabilities
         return ImplementationCapabilities(
             supported_types=["cnt", "dir", "rev", "rel", "snp"],
             supported_qualifiers=[],
@@ -48,62 +48,75 @@ class MockImplementation(SwhidImplementation):
     def compute_swhid(self, payload_path: str, obj_type: str = None, 
                      commit: Optional[str] = None, tag: Optional[str] = None,
                      version: Optional[int] = None, hash_algo: Optional[str] = None) -> str:
-        if not self._available:
+        if not self.available:
             raise RuntimeError("Implementation not available")
-        if self._error:
-            raise RuntimeError(self._error)
-        return self._swhid
+        if self.error:
+            raise RuntimeError(self.error)
+        return self.swhid
+
+
+_HARNESS_CONFIG = {
+    "output": {"results_dir": "test_results"},
+    "settings": {"parallel_tests": 2},
+    "payloads": {
+        "content": [
+            {"name": "test", "path": "/test/path"}
+        ]
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def harness_config_path(tmp_path_factory):
+    """Write the shared test configuration once per module.
+
+    JSON is valid YAML, so the harness loader reads it unchanged while
+    the fixture avoids PyYAML's emitter.
+    """
+    config_path = tmp_path_factory.mktemp("config") / "config.yaml"
+    config_path.write_text(json.dumps(_HARNESS_CONFIG))
+    return str(config_path)
+
+
+@pytest.fixture(scope="module")
+def harness_factory(harness_config_path):
+    """Return a callable building a fresh harness from the shared configuration file.
+    
+    Each call runs SwhidHarness.__init__, so no managers are shared between
+    tests and ImplementationDiscovery is looked up when the test calls it.
+    """
+    def make_harness() -> SwhidHarness:
+        return SwhidHarness(harness_config_path)
+    
+    return make_harness
+
+
+@pytest.fixture(scope="module")
+def bare_harness():
+    """Harness built without __init__, carrying only the (stateless) comparator."""
+    from harness.comparator import ResultComparator
+    harness = SwhidHarness.__new__(SwhidHarness)
+    harness.comparator = ResultComparator()
+    return harness
 
 
 class TestSwhidHarness:
     """Test SwhidHarness class."""
     
-    def test_harness_initialization(self):
+    def test_harness_initialization(self, harness_factory, harness_config_path):
         """Test harness initialization with default config."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            config = {
-                "output": {"results_dir": "test_results"},
-                "settings": {"parallel_tests": 2},
-                "payloads": {
-                    "content": [
-                        {"name": "test", "path": "/test/path"}
-                    ]
-                }
-            }
-            yaml.dump(config, f)
-            config_path = f.name
-        
-        try:
-            harness = SwhidHarness(config_path)
-            assert harness.config_path == config_path
-            assert harness.results_dir == Path("test_results")
-        finally:
-            os.unlink(config_path)
+        harness = harness_factory()
+        assert harness.config_path == harness_config_path
+        assert harness.results_dir == Path("test_results")
     
-    def test_load_config(self):
+    def test_load_config(self, harness_factory):
         """Test config loading."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            config = {
-                "output": {"results_dir": "test_results"},
-                "settings": {"parallel_tests": 2},
-                "payloads": {
-                    "content": [
-                        {"name": "test", "path": "/test/path"}
-                    ]
-                }
-            }
-            yaml.dump(config, f)
-            config_path = f.name
-        
-        try:
-            harness = SwhidHarness(config_path)
-            assert harness.config.output.results_dir == "test_results"
-            assert harness.config.settings.parallel_tests == 2
-        finally:
-            os.unlink(config_path)
+        harness = harness_factory()
+        assert harness.config.output.results_dir == "test_results"
+        assert harness.config.settings.parallel_tests == 2
     
     @patch('harness.harness.ImplementationDiscovery')
-    def test_load_implementations(self, mock_discovery_class):
+    def test_load_implementations(self, mock_discovery_class, harness_factory):
         """Test loading implementations."""
         # Setup mock discovery
         mock_discovery = Mock()
@@ -115,31 +128,15 @@ class TestSwhidHarness:
         }
         mock_discovery_class.return_value = mock_discovery
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            config = {
-                "output": {"results_dir": "test_results"},
-                "settings": {"parallel_tests": 2},
-                "payloads": {
-                    "content": [
-                        {"name": "test", "path": "/test/path"}
-                    ]
-                }
-            }
-            yaml.dump(config, f)
-            config_path = f.name
+        harness = harness_factory()
+        implementations = harness._load_implementations()
         
-        try:
-            harness = SwhidHarness(config_path)
-            implementations = harness._load_implementations()
-            
-            assert len(implementations) == 2
-            assert "impl1" in implementations
-            assert "impl2" in implementations
-        finally:
-            os.unlink(config_path)
+        assert len(implementations) == 2
+        assert "impl1" in implementations
+        assert "impl2" in implementations
     
     @patch('harness.harness.ImplementationDiscovery')
-    def test_load_implementations_filtered(self, mock_discovery_class):
+    def test_load_implementations_filtered(self, mock_discovery_class, harness_factory):
         """Test loading filtered implementations."""
         # Setup mock discovery
         mock_discovery = Mock()
@@ -151,177 +148,72 @@ class TestSwhidHarness:
         }
         mock_discovery_class.return_value = mock_discovery
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            config = {
-                "output": {"results_dir": "test_results"},
-                "settings": {"parallel_tests": 2},
-                "payloads": {
-                    "content": [
-                        {"name": "test", "path": "/test/path"}
-                    ]
-                }
-            }
-            yaml.dump(config, f)
-            config_path = f.name
+        harness = harness_factory()
+        implementations = harness._load_implementations(["impl1"])
         
-        try:
-            harness = SwhidHarness(config_path)
-            implementations = harness._load_implementations(["impl1"])
-            
-            assert len(implementations) == 1
-            assert "impl1" in implementations
-            assert "impl2" not in implementations
-        finally:
-            os.unlink(config_path)
+        assert len(implementations) == 1
+        assert "impl1" in implementations
+        assert "impl2" not in implementations
     
-    def test_run_single_test_success(self):
+    def test_run_single_test_success(self, harness_factory, tmp_content_file):
         """Test running a single successful test."""
         impl = MockImplementation("test-impl", available=True, swhid="swh:1:cnt:success123")
         
-        with tempfile.NamedTemporaryFile() as f:
-            f.write(b"test content")
-            f.flush()
-            
-            harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-            from harness.config import HarnessConfig, OutputConfig, SettingsConfig
-            from harness.resource_manager import ResourceManager
-            from harness.git_manager import GitManager
-            harness.config = HarnessConfig(
-                schema_version="1.0.0",
-                output=OutputConfig(results_dir="test_results"),
-                payloads={"content": [{"name": "test", "path": "/test"}]},
-                settings=SettingsConfig(parallel_tests=1)
-            )
-            harness.config_path = "/tmp/test_config.yaml"
-            harness.implementations = {"test-impl": impl}
-            harness.resource_manager = ResourceManager()
-            harness.git_manager = GitManager()
-            harness.test_runner = None  # Will be initialized lazily
-            result = harness._run_single_test(impl, f.name, "test_file")
-            
-            assert result.success is True
-            assert result.swhid == "swh:1:cnt:success123"
-            assert result.implementation == "test-impl"
-            assert result.error is None
+        harness = harness_factory()
+        harness.implementations = {"test-impl": impl}
+        result = harness._run_single_test(impl, tmp_content_file, "test_file")
+        
+        assert result.success is True
+        assert result.swhid == "swh:1:cnt:success123"
+        assert result.implementation == "test-impl"
+        assert result.error is None
     
-    def test_run_single_test_failure(self):
+    def test_run_single_test_failure(self, harness_factory, tmp_content_file):
         """Test running a single failed test."""
         impl = MockImplementation("test-impl", available=True, error="Test error")
         
-        with tempfile.NamedTemporaryFile() as f:
-            f.write(b"test content")
-            f.flush()
-            
-            harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-            from harness.config import HarnessConfig, OutputConfig, SettingsConfig
-            from harness.resource_manager import ResourceManager
-            from harness.git_manager import GitManager
-            harness.config = HarnessConfig(
-                schema_version="1.0.0",
-                output=OutputConfig(results_dir="test_results"),
-                payloads={"content": [{"name": "test", "path": "/test"}]},
-                settings=SettingsConfig(parallel_tests=1)
-            )
-            harness.config_path = "/tmp/test_config.yaml"
-            harness.implementations = {"test-impl": impl}
-            harness.resource_manager = ResourceManager()
-            harness.git_manager = GitManager()
-            harness.test_runner = None  # Will be initialized lazily
-            result = harness._run_single_test(impl, f.name, "test_file")
-            
-            assert result.success is False
-            assert result.swhid is None
-            assert result.error == "Test error"
+        harness = harness_factory()
+        harness.implementations = {"test-impl": impl}
+        result = harness._run_single_test(impl, tmp_content_file, "test_file")
+        
+        assert result.success is False
+        assert result.swhid is None
+        assert result.error == "Test error"
     
-    def test_compare_results_all_match(self):
-        """Test comparing results when all match."""
+    @pytest.mark.parametrize("r1_swhid,r2_swhid,r2_error,expected,expect_match", [
+        ("swh:1:cnt:test123", "swh:1:cnt:test123", None, None, True),
+        ("swh:1:cnt:test123", "swh:1:cnt:different", None, None, False),
+        ("swh:1:cnt:test123", None, "Error occurred", None, False),
+        ("swh:1:cnt:expected123", "swh:1:cnt:expected123", None, "swh:1:cnt:expected123", True),
+        ("swh:1:cnt:actual123", "swh:1:cnt:actual123", None, "swh:1:cnt:expected123", False),
+    ], ids=["all_match", "no_match", "with_failure", "with_expected", "with_wrong_expected"])
+    def test_compare_results(self, bare_harness, r1_swhid, r2_swhid, r2_error, expected, expect_match):
+        """Test comparing two implementations' results, optionally against an expected SWHID."""
         results = {
-            "impl1": SwhidTestResult("test.txt", "/path", "impl1", "swh:1:cnt:test123", None, 1.0, True),
-            "impl2": SwhidTestResult("test.txt", "/path", "impl2", "swh:1:cnt:test123", None, 1.5, True)
+            "impl1": SwhidTestResult("test.txt", "/path", "impl1", r1_swhid, None, 1.0, True),
+            "impl2": SwhidTestResult("test.txt", "/path", "impl2", r2_swhid, r2_error, 1.5, r2_error is None)
         }
         
-        harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-        from harness.comparator import ResultComparator
-        harness.comparator = ResultComparator()
-        comparison = harness._compare_results("test.txt", "/path/to/test.txt", results)
+        comparison = bare_harness._compare_results("test.txt", "/path/to/test.txt", results, expected)
         
-        assert comparison.all_match is True
+        assert comparison.all_match is expect_match
         assert comparison.payload_name == "test.txt"
         assert len(comparison.results) == 2
+        assert comparison.expected_swhid == expected
     
-    def test_compare_results_no_match(self):
-        """Test comparing results when they don't match."""
-        results = {
-            "impl1": SwhidTestResult("test.txt", "/path", "impl1", "swh:1:cnt:test123", None, 1.0, True),
-            "impl2": SwhidTestResult("test.txt", "/path", "impl2", "swh:1:cnt:different", None, 1.5, True)
-        }
-        
-        harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-        from harness.comparator import ResultComparator
-        harness.comparator = ResultComparator()
-        comparison = harness._compare_results("test.txt", "/path/to/test.txt", results)
-        
-        assert comparison.all_match is False
-    
-    def test_compare_results_with_failure(self):
-        """Test comparing results when some implementations fail."""
-        results = {
-            "impl1": SwhidTestResult("test.txt", "/path", "impl1", "swh:1:cnt:test123", None, 1.0, True),
-            "impl2": SwhidTestResult("test.txt", "/path", "impl2", None, "Error occurred", 1.5, False)
-        }
-        
-        harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-        from harness.comparator import ResultComparator
-        harness.comparator = ResultComparator()
-        comparison = harness._compare_results("test.txt", "/path/to/test.txt", results)
-        
-        assert comparison.all_match is False
-    
-    def test_compare_results_with_expected(self):
-        """Test comparing results with expected SWHID."""
-        results = {
-            "impl1": SwhidTestResult("test.txt", "/path", "impl1", "swh:1:cnt:expected123", None, 1.0, True),
-            "impl2": SwhidTestResult("test.txt", "/path", "impl2", "swh:1:cnt:expected123", None, 1.5, True)
-        }
-        
-        harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-        from harness.comparator import ResultComparator
-        harness.comparator = ResultComparator()
-        comparison = harness._compare_results("test.txt", "/path/to/test.txt", results, "swh:1:cnt:expected123")
-        
-        assert comparison.all_match is True
-        assert comparison.expected_swhid == "swh:1:cnt:expected123"
-    
-    def test_compare_results_with_wrong_expected(self):
-        """Test comparing results with wrong expected SWHID."""
-        results = {
-            "impl1": SwhidTestResult("test.txt", "/path", "impl1", "swh:1:cnt:actual123", None, 1.0, True),
-            "impl2": SwhidTestResult("test.txt", "/path", "impl2", "swh:1:cnt:actual123", None, 1.5, True)
-        }
-        
-        harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-        from harness.comparator import ResultComparator
-        harness.comparator = ResultComparator()
-        comparison = harness._compare_results("test.txt", "/path/to/test.txt", results, "swh:1:cnt:expected123")
-        
-        assert comparison.all_match is False
-    
-    def test_compare_results_negative_test_all_fail(self):
+    def test_compare_results_negative_test_all_fail(self, bare_harness):
         """Test negative tests where all implementations should fail."""
         results = {
             "impl1": SwhidTestResult("test.txt", "/path", "impl1", None, "Error: invalid input", 1.0, False),
             "impl2": SwhidTestResult("test.txt", "/path", "impl2", None, "Error: invalid input", 1.5, False)
         }
         
-        harness = SwhidHarness.__new__(SwhidHarness)  # Create without __init__
-        from harness.comparator import ResultComparator
-        harness.comparator = ResultComparator()
-        comparison = harness._compare_results("test.txt", "/path/to/test.txt", results, expected_error="COMPUTE_ERROR")
+        comparison = bare_harness._compare_results("test.txt", "/path/to/test.txt", results, expected_error="COMPUTE_ERROR")
         
         # Negative test passes when all implementations correctly reject invalid input
         assert comparison.all_match is True
     
-    def test_compare_results_only_unsupported(self):
+    def test_compare_results_only_unsupported(self, bare_harness):
         """Tests with only unsupported implementations should be marked as skipped (match)."""
         unsupported_error = "Object type 'snapshot' (SWHID code 'snp') not supported by implementation"
         results = {
@@ -329,10 +221,7 @@ class TestSwhidHarness:
             "impl2": SwhidTestResult("test.txt", "/path", "impl2", None, unsupported_error, 0.0, False)
         }
         
-        harness = SwhidHarness.__new__(SwhidHarness)
-        from harness.comparator import ResultComparator
-        harness.comparator = ResultComparator()
-        comparison = harness._compare_results("test.txt", "/path/to/test.txt", results)
+        comparison = bare_harness._compare_results("test.txt", "/path/to/test.txt", results)
         
         assert comparison.all_match is True
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Unit tests for the structured result diff in tools/json_diff.py"""
+
+import copy
+import time
+
+import pytest
+
+from tools.json_diff import ResultDiff
+
+
+def _large_results(tests=20000, impls=6):
+    """Build a results-shaped document with tests x impls results."""
+    return {"tests": [
+        {"id": f"t{i}", "ok": True, "results": [
+            {"implementation": f"impl{j}", "status": "PASS", "swhid": "swh:1:cnt:" + "0" * 40}
+            for j in range(impls)
+        ]}
+        for i in range(tests)
+    ]}
+
+
+def _diff(expected, actual):
+    diff = ResultDiff()
+    diff.compare_values("", expected, actual)
+    return diff.to_dict()
+
+
+def test_equal_documents_have_no_diff():
+    """Test that identical documents produce no differences."""
+    doc = {"a": [1, 2, {"b": None}], "c": "x"}
+    assert _diff(doc, {"a": [1, 2, {"b": None}], "c": "x"}) == []
+
+
+@pytest.mark.parametrize("expected,actual", [
+    ([1, 2, 3], [3, 1, 2]),
+    ([[1, 2], [3]], [[3], [1, 2]]),
+    ([{"id": 1}, {"id": 2}], [{"id": 2}, {"id": 1}]),
+], ids=["scalars", "nested_lists", "dicts"])
+def test_reordered_list_is_ordering(expected, actual):
+    """Test that a reordered list is reported once, as an ordering diff."""
+    assert _diff({"x": expected}, {"x": actual}) == [
+        {"path": "/x", "expected": expected, "actual": actual, "category": "ordering"}
+    ]
+
+
+def test_changed_nested_list_is_value_mismatch():
+    """Test that lists with different elements are compared element by element."""
+    assert _diff([[1, 2], [3]], [[1, 2], [4]]) == [
+        {"path": "/1/0", "expected": 3, "actual": 4, "category": "value_mismatch"}
+    ]
+
+
+@pytest.mark.parametrize("expected,actual", [
+    ({"a": True}, {"a": 1}),
+    ({"a": False}, {"a": 0}),
+    ({"a": 1}, {"a": True}),
+    ({"a": 0}, {"a": False}),
+], ids=["true_vs_1", "false_vs_0", "1_vs_true", "0_vs_false"])
+def test_bool_differs_from_number(expected, actual):
+    """Test that JSON booleans are never equal to the numbers 0 and 1."""
+    assert _diff(expected, actual) == [
+        {"path": "/a", "expected": expected["a"], "actual": actual["a"], "category": "value_mismatch"}
+    ]
+
+
+def test_bool_differs_from_number_inside_list():
+    """Test that a bool/number difference nested in a list is reported."""
+    assert _diff([True, 0], [1, False]) == [
+        {"path": "/0", "expected": True, "actual": 1, "category": "value_mismatch"},
+        {"path": "/1", "expected": 0, "actual": False, "category": "value_mismatch"},
+    ]
+
+
+def test_int_and_float_are_both_numbers():
+    """Test that equal ints and floats compare equal, as JSON numbers."""
+    assert _diff({"a": 1}, {"a": 1.0}) == []
+
+
+def test_large_equal_documents_are_fast():
+    """Test that equal documents are not walked node by node."""
+    expected = _large_results()
+    actual = copy.deepcopy(expected)
+    start = time.perf_counter()
+    assert _diff(expected, actual) == []
+    assert time.perf_counter() - start < 1.0
+
+
+def test_bool_hidden_in_large_document_is_found():
+    """Test that the equality fast path still reports a nested bool/number swap."""
+    expected = _large_results(tests=200)
+    actual = copy.deepcopy(expected)
+    actual["tests"][150]["ok"] = 1
+    assert _diff(expected, actual) == [
+        {"path": "/tests/150/ok", "expected": True, "actual": 1, "category": "value_mismatch"}
+    ]
+
+
+def test_reordered_dicts_ignore_key_order():
+    """Test that dict elements match regardless of their key order."""
+    expected = [{"a": 1, "b": 2}, {"c": 3}]
+    actual = [{"c": 3}, {"b": 2, "a": 1}]
+    assert _diff({"x": expected}, {"x": actual}) == [
+        {"path": "/x", "expected": expected, "actual": actual, "category": "ordering"}
+    ]
+
+
+def test_single_diff_in_large_document_is_fast():
+    """Test that a large list is serialized once per level, not once per check."""
+    expected = _large_results()
+    actual = copy.deepcopy(expected)
+    actual["tests"][15000]["results"][3]["status"] = "FAIL"
+    start = time.perf_counter()
+    assert _diff(expected, actual) == [
+        {"path": "/tests/15000/results/3/status", "expected": "PASS", "actual": "FAIL",
+         "category": "value_mismatch"}
+    ]
+    assert time.perf_counter() - start < 2.0
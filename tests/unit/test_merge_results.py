@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Unit tests for tools/merge_results.py"""
+
+import json
+import os
+
+import pytest
+
+from tools import merge_results
+from tools.merge_results import (
+    create_failure_index,
+    create_index_data,
+    main,
+    normalize_platform_name,
+    paginate_index,
+    run_has_failure,
+)
+
+
+def _results(run_id, created_at="2024-01-01T00:00:00Z", statuses=("PASS", "PASS"), os_name="ubuntu-22.04"):
+    """Build a canonical results document with one test and one result per status."""
+    impls = [f"impl{i}" for i in range(len(statuses))]
+    return {
+        "run": {
+            "id": run_id,
+            "created_at": created_at,
+            "branch": "main",
+            "commit": "abcdef0",
+            "runner": {"os": os_name},
+        },
+        "implementations": [{"id": impl} for impl in impls],
+        "tests": [{
+            "id": "t0",
+            "results": [{"implementation": impl, "status": status} for impl, status in zip(impls, statuses)],
+        }],
+    }
+
+
+@pytest.fixture
+def results_files(tmp_path):
+    """Write two results files and return their paths."""
+    paths = []
+    for i, results in enumerate([
+        _results("run0", "2024-01-01T00:00:00Z"),
+        _results("run1", "2024-01-02T00:00:00Z", statuses=("PASS", "FAIL"), os_name="macos-14"),
+    ]):
+        path = tmp_path / f"results{i}.json"
+        path.write_text(json.dumps(results, indent=2))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def site(tmp_path):
+    return tmp_path / "site"
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.mark.parametrize("os_string,expected", [
+    ("ubuntu-22.04", "Ubuntu"),
+    ("Linux", "Ubuntu"),
+    ("macos-14", "macOS"),
+    ("Darwin 23.0", "macOS"),
+    ("windows-2022", "Windows"),
+    ("freebsd-13", "freebsd"),
+    ("Unknown", "Unknown"),
+    # Strings naming several platforms resolve as the original if/elif
+    # chain did: ubuntu/linux, then macos/darwin, then windows
+    ("macos-ubuntu-cross", "Ubuntu"),
+    ("windows-linux-wsl", "Ubuntu"),
+    ("windows-darwin", "macOS"),
+], ids=lambda value: value)
+def test_normalize_platform_name(os_string, expected):
+    """Test that runner OS strings map to friendly platform names."""
+    assert normalize_platform_name(os_string) == expected
+
+
+class TestRunFiles:
+    """Test writing, skipping and linking the per-run files."""
+    
+    def test_rerun_skips_unchanged_run_files(self, results_files, site, cache_dir, capsys):
+        """Test that the manifest leaves unchanged run files untouched."""
+        args = results_files + ["--site", str(site), "--cache-dir", str(cache_dir)]
+        assert main(args) == 0
+        run_file = site / "data" / "runs" / "run0.json"
+        before = os.stat(run_file)
+        capsys.readouterr()
+        
+        assert main(args) == 0
+        out = capsys.readouterr().out
+        assert f"Unchanged {run_file}" in out
+        after = os.stat(run_file)
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    
+    def test_changed_or_missing_run_files_are_rewritten(self, results_files, site, cache_dir, capsys):
+        """Test that a changed input or a deleted run file is written again."""
+        args = results_files + ["--site", str(site), "--cache-dir", str(cache_dir)]
+        assert main(args) == 0
+        runs_dir = site / "data" / "runs"
+        (runs_dir / "run0.json").unlink()
+        with open(results_files[1], "w") as f:
+            json.dump(_results("run1", "2024-01-02T00:00:00Z", statuses=("FAIL", "FAIL")), f)
+        capsys.readouterr()
+        
+        assert main(args) == 0
+        out = capsys.readouterr().out
+        assert f"Wrote {runs_dir / 'run0.json'}" in out
+        assert f"Wrote {runs_dir / 'run1.json'}" in out
+        run1 = json.loads((runs_dir / "run1.json").read_text())
+        assert [r["status"] for r in run1["tests"][0]["results"]] == ["FAIL", "FAIL"]
+    
+    def test_without_cache_dir_every_run_file_is_written(self, results_files, site, capsys):
+        """Test that without a cache directory no run file is skipped."""
+        args = results_files + ["--site", str(site)]
+        assert main(args) == 0
+        assert main(args) == 0
+        assert "Unchanged" not in capsys.readouterr().out
+    
+    def test_bookkeeping_stays_out_of_site(self, results_files, site, cache_dir):
+        """Test that cache files are written to the cache directory, not the site."""
+        assert main(results_files + ["--site", str(site), "--cache-dir", str(cache_dir)]) == 0
+        assert main(results_files + ["--site", str(site), "--cache-dir", str(cache_dir), "--index-only"]) == 0
+        published = sorted(p.relative_to(site).as_posix() for p in site.rglob("*") if p.is_file())
+        assert published == [
+            "data/index-000.json", "data/index.json", "data/latest.json",
+            "data/runs/run0.json", "data/runs/run1.json",
+        ]
+        assert (cache_dir / "run-manifest.json").exists()
+        assert (cache_dir / "summary-cache.json").exists()
+    
+    def test_hardlink_links_run_files(self, results_files, site):
+        """Test that --hardlink links each run file to its results file."""
+        assert main(results_files + ["--site", str(site), "--hardlink"]) == 0
+        assert os.path.samefile(results_files[0], site / "data" / "runs" / "run0.json")
+    
+    @pytest.mark.parametrize("mode", ["--hardlink", "--index-only"])
+    def test_failed_link_falls_back(self, results_files, site, monkeypatch, mode):
+        """Test that run files are still published when hardlinking fails."""
+        def no_link(src, dst):
+            raise OSError("cross-device link")
+        monkeypatch.setattr(os, "link", no_link)
+        
+        assert main(results_files + ["--site", str(site), mode]) == 0
+        run_file = site / "data" / "runs" / "run0.json"
+        assert not os.path.samefile(results_files[0], run_file)
+        with open(results_files[0]) as f:
+            assert json.loads(run_file.read_text()) == json.load(f)
+
+
+def _read_index(site):
+    with open(site / "data" / "index.json") as f:
+        index = json.load(f)
+    index.pop("last_updated")
+    return index
+
+
+class TestSummaryCache:
+    """Test reusing results summaries across --index-only merges."""
+    
+    @pytest.fixture
+    def summarized(self, monkeypatch):
+        """Record which files are summarized by parsing them."""
+        parsed = []
+        load_results_summary = merge_results.load_results_summary
+        
+        def recording_load(file_path):
+            parsed.append(file_path)
+            return load_results_summary(file_path)
+        monkeypatch.setattr(merge_results, "load_results_summary", recording_load)
+        return parsed
+    
+    def test_second_run_hits_cache(self, results_files, site, cache_dir, summarized):
+        """Test that unchanged results files are not parsed again."""
+        args = results_files + ["--site", str(site), "--cache-dir", str(cache_dir), "--index-only"]
+        assert main(args) == 0
+        first_index = _read_index(site)
+        assert sorted(summarized) == sorted(results_files)
+        summarized.clear()
+        
+        assert main(args) == 0
+        assert summarized == []
+        assert _read_index(site) == first_index
+    
+    def test_changed_file_misses_cache(self, results_files, site, cache_dir, summarized):
+        """Test that only a changed results file is parsed again."""
+        args = results_files + ["--site", str(site), "--cache-dir", str(cache_dir), "--index-only"]
+        assert main(args) == 0
+        with open(results_files[0], "w") as f:
+            json.dump(_results("run0", statuses=("FAIL", "FAIL")), f)
+        summarized.clear()
+        
+        assert main(args) == 0
+        assert summarized == [results_files[0]]
+        assert _read_index(site)["total_failed"] == 3
+    
+    def test_cache_keeps_only_current_inputs(self, results_files, site, cache_dir):
+        """Test that entries for results files no longer merged are dropped."""
+        assert main(results_files + ["--site", str(site), "--cache-dir", str(cache_dir), "--index-only"]) == 0
+        assert main(results_files[:1] + ["--site", str(site), "--cache-dir", str(cache_dir), "--index-only"]) == 0
+        with open(cache_dir / "summary-cache.json") as f:
+            assert len(json.load(f)) == 1
+    
+    def test_corrupt_cache_is_ignored(self, results_files, site, cache_dir, summarized):
+        """Test that an unreadable cache falls back to parsing every file."""
+        cache_dir.mkdir()
+        (cache_dir / "summary-cache.json").write_text("not json")
+        assert main(results_files + ["--site", str(site), "--cache-dir", str(cache_dir), "--index-only"]) == 0
+        assert sorted(summarized) == sorted(results_files)
+
+
+class TestIndexPages:
+    """Test splitting the index runs into pages."""
+    
+    def test_paginate_index(self):
+        """Test that runs are split into pages and listed in the top-level index."""
+        index = {"total_runs": 5, "runs": [{"id": f"run{i}"} for i in range(5)]}
+        top_level, pages = paginate_index(index, 2)
+        
+        assert top_level == {
+            "total_runs": 5,
+            "pages": ["index-000.json", "index-001.json", "index-002.json"],
+        }
+        assert [page["page"] for page in pages] == [0, 1, 2]
+        assert [[run["id"] for run in page["runs"]] for page in pages] == [
+            ["run0", "run1"], ["run2", "run3"], ["run4"],
+        ]
+    
+    def test_paginate_index_without_runs(self):
+        """Test that an index without runs has no pages."""
+        assert paginate_index({"runs": []}, 500) == ({"pages": []}, [])
+    
+    def test_pages_hold_runs_newest_first(self, results_files, site):
+        """Test that pages written by main hold the runs newest first."""
+        assert main(results_files + ["--site", str(site), "--batch-size", "1"]) == 0
+        data_dir = site / "data"
+        with open(data_dir / "index.json") as f:
+            assert json.load(f)["pages"] == ["index-000.json", "index-001.json"]
+        runs = []
+        for page_name in ["index-000.json", "index-001.json"]:
+            with open(data_dir / page_name) as f:
+                runs.extend(run["id"] for run in json.load(f)["runs"])
+        assert runs == ["run1", "run0"]
+    
+    def test_stale_pages_are_removed(self, results_files, site):
+        """Test that pages left over from a merge with more pages are deleted."""
+        assert main(results_files + ["--site", str(site), "--batch-size", "1"]) == 0
+        assert main(results_files + ["--site", str(site), "--batch-size", "10"]) == 0
+        assert sorted(p.name for p in (site / "data").glob("index-*.json")) == ["index-000.json"]
+    
+    def test_batch_size_must_be_positive(self, results_files, site):
+        """Test that a batch size below 1 is rejected."""
+        with pytest.raises(SystemExit):
+            main(results_files + ["--site", str(site), "--batch-size", "0"])
+
+
+class TestFailFast:
+    """Test the --fail-fast pass/fail check."""
+    
+    def test_run_has_failure_stops_at_first_failure(self):
+        """Test that later tests are not inspected once a failure is found."""
+        class Unreadable(dict):
+            def __getitem__(self, key):
+                raise AssertionError("inspected a test after the first failure")
+        
+        results = _results("run0", statuses=("PASS", "FAIL"))
+        results["tests"].append(Unreadable())
+        assert run_has_failure(results)
+        assert not run_has_failure(_results("run1"))
+    
+    def test_create_failure_index(self):
+        """Test the minimal index: per-run failure flags, newest run first."""
+        index = create_failure_index([
+            _results("run0", "2024-01-01T00:00:00Z"),
+            _results("run1", "2024-01-02T00:00:00Z", statuses=("SKIPPED", "PASS")),
+        ])
+        assert index["total_runs"] == 2
+        assert index["has_failure"] is True
+        assert [(run["id"], run["has_failure"]) for run in index["runs"]] == [("run1", True), ("run0", False)]
+    
+    def test_create_index_data_keeps_its_schema(self):
+        """Test that create_index_data still reports status counts."""
+        index = create_index_data([_results("run0", statuses=("PASS", "FAIL"))])
+        assert (index["total_passed"], index["total_failed"], index["total_results"]) == (1, 1, 2)
+        assert "has_failure" not in index
+    
+    def test_exit_code_on_failure(self, results_files, site, capsys):
+        """Test that --fail-fast exits 1 when a run has failures, writing nothing."""
+        assert main(results_files + ["--site", str(site), "--fail-fast"]) == 1
+        out = capsys.readouterr().out
+        assert "run1: has failures" in out
+        assert "run0: all tests passed" in out
+        assert not site.exists()
+    
+    def test_exit_code_when_all_pass(self, results_files, site):
+        """Test that --fail-fast exits 0 when every run passed."""
+        assert main(results_files[:1] + ["--site", str(site), "--fail-fast", "--index-only"]) == 0
+        assert not site.exists()
+    
+    def test_exit_code_without_results(self, tmp_path, site):
+        """Test that --fail-fast exits 1 when no results file exists."""
+        assert main([str(tmp_path / "missing.json"), "--site", str(site), "--fail-fast"]) == 1
@@ -15,6 +15,16 @@ from harness.plugins.base import (
 from harness.plugins.discovery import ImplementationDiscovery
 
 
+_MOCK_CAPS = ImplementationCapabilities(
+    supported_types=["cnt", "dir"],
+    supported_qualifiers=[],
+    api_version="1.0",
+    max_payload_size_mb=100,
+    supports_unicode=True,
+    supports_percent_encoding=True
+)
+
+
 class MockImplementation(SwhidImplementation):
     """Mock implementation for testing."""
     
@@ -35,15 +45,7 @@ class MockImplementation(SwhidImplementation):
         return self._available
     
     def get_capabilities(self):
-        from harness.plugins.base import ImplementationCapabilities
-        return ImplementationCapabilities(
-            supported_types=["cnt", "dir"],
-            supported_qualifiers=[],
-            api_version="1.0",
-            max_payload_size_mb=100,
-            supports_unicode=True,
-            supports_percent_encoding=True
-        )
+        return _MOCK_CAPS
     
     def compute_swhid(self, payload_path: str, obj_type: str = None) -> str:
         if not self._available:
@@ -134,21 +136,19 @@ class TestSwhidImplementation:
         assert impl.is_available() is True
         assert impl.compute_swhid("/test/path") == "swh:1:cnt:test123"
     
-    def test_detect_object_type_file(self):
+    def test_detect_object_type_file(self, tmp_content_file):
         """Test object type detection for files."""
         impl = MockImplementation()
         
-        with tempfile.NamedTemporaryFile() as f:
-            obj_type = impl.detect_object_type(f.name)
-            assert obj_type == "content"
+        obj_type = impl.detect_object_type(tmp_content_file)
+        assert obj_type == "content"
     
-    def test_detect_object_type_directory(self):
+    def test_detect_object_type_directory(self, tmp_content_file):
         """Test object type detection for directories."""
         impl = MockImplementation()
         
-        with tempfile.TemporaryDirectory() as d:
-            obj_type = impl.detect_object_type(d)
-            assert obj_type == "directory"
+        obj_type = impl.detect_object_type(os.path.dirname(tmp_content_file))
+        assert obj_type == "directory"
     
     def test_detect_object_type_nonexistent(self):
         """Test object type detection for nonexistent path."""
@@ -157,32 +157,24 @@ class TestSwhidImplementation:
         with pytest.raises(ValueError):
             impl.detect_object_type("/nonexistent/path")
     
-    def test_benchmark(self):
+    def test_benchmark(self, tmp_content_file):
         """Test benchmark method."""
         impl = MockImplementation()
         
-        with tempfile.NamedTemporaryFile() as f:
-            f.write(b"test content")
-            f.flush()
-            
-            result = impl.benchmark(f.name, iterations=5)
-            
-            assert result.implementation == "mock"
-            assert result.iterations == 5
-            assert result.mean_duration_ms > 0
-            assert result.min_duration_ms > 0
-            assert result.max_duration_ms > 0
+        result = impl.benchmark(tmp_content_file, iterations=5)
+        
+        assert result.implementation == "mock"
+        assert result.iterations == 5
+        assert result.mean_duration_ms > 0
+        assert result.min_duration_ms > 0
+        assert result.max_duration_ms > 0
     
-    def test_benchmark_failure(self):
+    def test_benchmark_failure(self, tmp_content_file):
         """Test benchmark with failing implementation."""
         impl = MockImplementation(available=False)
         
-        with tempfile.NamedTemporaryFile() as f:
-            f.write(b"test content")
-            f.flush()
-            
-            with pytest.raises(RuntimeError, match="All benchmark iterations failed"):
-                impl.benchmark(f.name, iterations=5)
+        with pytest.raises(RuntimeError, match="All benchmark iterations failed"):
+            impl.benchmark(tmp_content_file, iterations=5)
 
 
 class TestImplementationDiscovery:
@@ -201,83 +193,22 @@ class TestImplementationDiscovery:
             implementations = discovery.discover_implementations()
             assert implementations == {}
     
-    def test_discover_implementations_with_mock(self):
+    def test_discover_implementations_with_mock(self, mock_impl_dir):
         """Test discovery with mock implementation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create mock implementation directory
-            impl_dir = Path(temp_dir) / "mock_impl"
-            impl_dir.mkdir()
-            
-            # Create implementation.py file
-            impl_file = impl_dir / "implementation.py"
-            impl_file.write_text('''
-from harness.plugins.base import SwhidImplementation, ImplementationInfo, ImplementationCapabilities
-
-class Implementation(SwhidImplementation):
-    def get_info(self):
-        return ImplementationInfo("mock", "1.0.0", "python")
-    
-    def is_available(self):
-        return True
-    
-    def get_capabilities(self):
-        return ImplementationCapabilities(
-            supported_types=["cnt", "dir"],
-            supported_qualifiers=[],
-            api_version="1.0",
-            max_payload_size_mb=100,
-            supports_unicode=True,
-            supports_percent_encoding=True
-        )
-    
-    def compute_swhid(self, payload_path, obj_type=None):
-        return "swh:1:cnt:mock123"
-''')
-            
-            discovery = ImplementationDiscovery(temp_dir)
-            implementations = discovery.discover_implementations()
-            
-            assert len(implementations) == 1
-            assert "mock" in implementations
-            assert implementations["mock"].get_info().name == "mock"
+        discovery = ImplementationDiscovery(str(mock_impl_dir))
+        implementations = discovery.discover_implementations()
+        
+        assert len(implementations) == 1
+        assert "mock" in implementations
+        assert implementations["mock"].get_info().name == "mock"
     
-    def test_get_implementation(self):
+    def test_get_implementation(self, mock_impl_dir):
         """Test getting specific implementation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create mock implementation
-            impl_dir = Path(temp_dir) / "mock_impl"
-            impl_dir.mkdir()
-            
-            impl_file = impl_dir / "implementation.py"
-            impl_file.write_text('''
-from harness.plugins.base import SwhidImplementation, ImplementationInfo, ImplementationCapabilities
-
-class Implementation(SwhidImplementation):
-    def get_info(self):
-        return ImplementationInfo("mock", "1.0.0", "python")
-    
-    def is_available(self):
-        return True
-    
-    def get_capabilities(self):
-        return ImplementationCapabilities(
-            supported_types=["cnt", "dir"],
-            supported_qualifiers=[],
-            api_version="1.0",
-            max_payload_size_mb=100,
-            supports_unicode=True,
-            supports_percent_encoding=True
-        )
-    
-    def compute_swhid(self, payload_path, obj_type=None):
-        return "swh:1:cnt:mock123"
-''')
-            
-            discovery = ImplementationDiscovery(temp_dir)
-            impl = discovery.get_implementation("mock")
-            
-            assert impl is not None
-            assert impl.get_info().name == "mock"
+        discovery = ImplementationDiscovery(str(mock_impl_dir))
+        impl = discovery.get_implementation("mock")
+        
+        assert impl is not None
+        assert impl.get_info().name == "mock"
     
     def test_get_nonexistent_implementation(self):
         """Test getting nonexistent implementation."""
@@ -286,42 +217,12 @@ class Implementation(SwhidImplementation):
             impl = discovery.get_implementation("nonexistent")
             assert impl is None
     
-    def test_list_available_implementations(self):
+    def test_list_available_implementations(self, mock_impl_dir):
         """Test listing available implementations."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create mock implementation
-            impl_dir = Path(temp_dir) / "mock_impl"
-            impl_dir.mkdir()
-            
-            impl_file = impl_dir / "implementation.py"
-            impl_file.write_text('''
-from harness.plugins.base import SwhidImplementation, ImplementationInfo, ImplementationCapabilities
-
-class Implementation(SwhidImplementation):
-    def get_info(self):
-        return ImplementationInfo("mock", "1.0.0", "python")
-    
-    def is_available(self):
-        return True
-    
-    def get_capabilities(self):
-        return ImplementationCapabilities(
-            supported_types=["cnt", "dir"],
-            supported_qualifiers=[],
-            api_version="1.0",
-            max_payload_size_mb=100,
-            supports_unicode=True,
-            supports_percent_encoding=True
-        )
-    
-    def compute_swhid(self, payload_path, obj_type=None):
-        return "swh:1:cnt:mock123"
-''')
-            
-            discovery = ImplementationDiscovery(temp_dir)
-            available = discovery.list_available_implementations()
-            
-            assert "mock" in available
+        discovery = ImplementationDiscovery(str(mock_impl_dir))
+        available = discovery.list_available_implementations()
+        
+        assert "mock" in available
     
     def test_clear_cache(self):
         """Test clearing implementation cache."""
@@ -330,3 +231,51 @@ class Implementation(SwhidImplementation):
         
         discovery.clear_cache()
         assert discovery._implementations_cache == {}
+    
+    def test_unchanged_plugin_module_is_cached(self, mock_impl_dir):
+        """Test that an unchanged implementation.py is only executed once."""
+        discovery = ImplementationDiscovery(str(mock_impl_dir))
+        first = discovery.discover_implementations()["mock"]
+        before = discovery.cache_info()
+        second = ImplementationDiscovery(str(mock_impl_dir)).discover_implementations()["mock"]
+        after = discovery.cache_info()
+        
+        assert type(first) is type(second)
+        assert first is not second
+        assert after.hits == before.hits + 1
+        assert after.misses == before.misses
+    
+    def test_force_reload_bypasses_module_cache(self, mock_impl_dir):
+        """Test that force_reload and reload_implementation execute the module again."""
+        discovery = ImplementationDiscovery(str(mock_impl_dir))
+        first = discovery.discover_implementations()["mock"]
+        before = discovery.cache_info()
+        reloaded = discovery.discover_implementations(force_reload=True)["mock"]
+        single = discovery.reload_implementation("mock_impl")
+        
+        assert type(reloaded) is not type(first)
+        assert type(single) is not type(reloaded)
+        assert discovery.cache_info() == before
+    
+    def test_failed_plugin_load_is_not_cached(self, tmp_path):
+        """Test that a plugin which fails to load is retried on the next discovery."""
+        (tmp_path / "broken").mkdir()
+        (tmp_path / "broken" / "implementation.py").write_text("raise ImportError('boom')\n")
+        discovery = ImplementationDiscovery(str(tmp_path))
+        before = discovery.cache_info()
+        
+        assert discovery.discover_implementations() == {}
+        assert discovery.discover_implementations() == {}
+        after = discovery.cache_info()
+        assert after.misses == before.misses + 2
+        assert after.currsize == before.currsize
+    
+    def test_clear_cache_keeps_other_instances_modules(self, mock_impl_dir):
+        """Test that clear_cache only drops the calling instance's implementations."""
+        discovery = ImplementationDiscovery(str(mock_impl_dir))
+        discovery.discover_implementations()
+        before = discovery.cache_info()
+        
+        ImplementationDiscovery(str(mock_impl_dir)).clear_cache()
+        assert discovery.cache_info().currsize == before.currsize
+        assert "mock" in discovery._implementations_cache
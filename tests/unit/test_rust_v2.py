@@ -8,7 +8,7 @@ import subprocess
 from unittest.mock import Mock, patch, MagicMock, call
 from pathlib import Path
 
-from implementations.rust.implementation import Implementation
+from implementations.rust.implementation import Implementation, _clear_project_root_cache
 
 
 class TestRustV2Support:
@@ -287,3 +287,108 @@ class TestRustV2Support:
             assert "--hash" in cmd
             assert result.startswith("swh:2:rev:")
 
+
+
+class TestRustContentCommand:
+    """Test how the Rust plugin picks the content command format."""
+    
+    @patch('implementations.rust.implementation.subprocess.run')
+    def test_only_help_probe_uses_short_timeout(self, mock_subprocess):
+        """Test that hashing a payload never runs under the probe timeout."""
+        from implementations.rust.implementation import _CONTENT_PROBE_TIMEOUT, _CONTENT_TIMEOUT
+        mock_subprocess.side_effect = [
+            Mock(returncode=0, stdout="Usage: swhid content <PATH>\n"),
+            Mock(returncode=0, stdout="swh:1:cnt:abc123\n"),
+        ]
+        
+        impl = Implementation()
+        result = impl._try_content_command("/path/to/swhid", "/payloads/large.txt", None, None)
+        
+        help_call, content_call = mock_subprocess.call_args_list
+        assert help_call[0][0] == ["/path/to/swhid", "content", "--help"]
+        assert help_call[1]["timeout"] == _CONTENT_PROBE_TIMEOUT
+        assert content_call[0][0] == ["/path/to/swhid", "content", "/payloads/large.txt"]
+        assert content_call[1]["timeout"] == _CONTENT_TIMEOUT
+        assert result == "swh:1:cnt:abc123"
+    
+    @patch('implementations.rust.implementation.subprocess.run')
+    def test_format_fallback_order(self, mock_subprocess):
+        """Test that the detected format is tried first and the other one on failure."""
+        mock_subprocess.side_effect = [
+            Mock(returncode=0, stdout="Usage: swhid content <PATH>\n"),
+            Mock(returncode=2, stdout=""),
+            Mock(returncode=0, stdout="swh:1:cnt:abc123\n"),
+            Mock(returncode=0, stdout="swh:1:cnt:abc123\n"),
+        ]
+        
+        impl = Implementation()
+        assert impl._try_content_command("/path/to/swhid", "/p", None, None) == "swh:1:cnt:abc123"
+        assert impl._content_command_format == "file_flag"
+        # The format that worked is remembered, so no probe on the next payload
+        assert impl._try_content_command("/path/to/swhid", "/p", None, None) == "swh:1:cnt:abc123"
+        
+        assert [c[0][0] for c in mock_subprocess.call_args_list] == [
+            ["/path/to/swhid", "content", "--help"],
+            ["/path/to/swhid", "content", "/p"],
+            ["/path/to/swhid", "content", "--file", "/p"],
+            ["/path/to/swhid", "content", "--file", "/p"],
+        ]
+
+
+class TestRustProjectRoot:
+    """Test the Rust plugin's project root lookup and its module-level cache."""
+    
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SWHID_RS_PATH", raising=False)
+        monkeypatch.chdir(tmp_path)
+        _clear_project_root_cache()
+        yield
+        _clear_project_root_cache()
+    
+    @patch('implementations.rust.implementation.time.monotonic')
+    @patch.object(Implementation, '_find_project_root')
+    def test_cache_hit_and_expiry(self, mock_find, mock_monotonic):
+        """Test that lookups are shared across instances until the TTL expires."""
+        from implementations.rust.implementation import _PROJECT_ROOT_TTL
+        mock_find.side_effect = ["/first", "/second"]
+        
+        mock_monotonic.return_value = 1000.0
+        assert Implementation()._get_project_root() == "/first"
+        mock_monotonic.return_value = 1000.0 + _PROJECT_ROOT_TTL - 1
+        assert Implementation()._get_project_root() == "/first"
+        assert mock_find.call_count == 1
+        
+        mock_monotonic.return_value = 1000.0 + _PROJECT_ROOT_TTL
+        assert Implementation()._get_project_root() == "/second"
+        assert mock_find.call_count == 2
+    
+    @patch.object(Implementation, '_find_project_root')
+    def test_clear_project_root_cache(self, mock_find):
+        """Test that clearing the cache forces a fresh lookup."""
+        mock_find.side_effect = ["/first", "/second"]
+        
+        assert Implementation()._get_project_root() == "/first"
+        _clear_project_root_cache()
+        assert Implementation()._get_project_root() == "/second"
+    
+    def test_finds_swhid_cargo_toml(self, tmp_path, monkeypatch):
+        """Test that a Cargo.toml for the swhid package marks the project root."""
+        (tmp_path / "Cargo.toml").write_text('[package]\nname = "swhid"\nversion = "0.1.0"\n')
+        (tmp_path / "src").mkdir()
+        monkeypatch.chdir(tmp_path / "src")
+        
+        assert Implementation()._find_project_root() == str(tmp_path)
+    
+    @pytest.mark.parametrize("filename,text", [
+        ("Cargo.toml", '[package]\nname = "other"\n'),
+        ("Cargo.toml", '[package]\nname = "harness"\n\n[[bin]]\nname = "swhid"\n'),
+        ("pyproject.toml", '[project]\nname = "swhid"\n'),
+        ("setup.py", 'from setuptools import setup\nsetup(name = "swhid")\n'),
+    ], ids=["other_package", "swhid_binary_only", "pyproject", "setup_py"])
+    def test_rejects_non_swhid_project(self, tmp_path, filename, text):
+        """Test that only a Cargo.toml whose package is swhid is accepted."""
+        (tmp_path / filename).write_text(text)
+        
+        assert Implementation._is_swhid_cargo_toml(tmp_path / filename) is False
+        assert Implementation()._find_project_root() is None
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """Unit tests for variant registry system in view_results.py"""
 
+import json
 import unittest
 from scripts.view_results import (
     VariantRegistry,
     detect_variants_in_results,
     filter_results_by_variant,
+    intern_swhids,
 )
 
 
@@ -323,6 +325,16 @@ class TestVariantDetection(unittest.TestCase):
         self.assertIn('implementations', filtered)
         self.assertEqual(filtered['run']['id'], 'test-run')
         self.assertEqual(len(filtered['implementations']), 2)
+    
+    def test_intern_swhids_shares_equal_strings(self):
+        """Test that equal expected and computed SWHIDs become the same object."""
+        # Round-trip through JSON so every string is a fresh object
+        results = json.loads(json.dumps(self.sample_results))
+        self.assertIs(intern_swhids(results), results)
+        
+        test = results['tests'][0]
+        self.assertIs(test['expected']['swhid'], test['results'][0]['swhid'])
+        self.assertIs(test['expected']['expected_swhid_sha256'], test['results'][1]['swhid'])
 
 
 if __name__ == '__main__':
@@ -1,14 +1,144 @@
 #!/usr/bin/env python3
 """Dashboard generator for SWHID test results."""
 
+import functools
+import io
 import json
+import os
 import shutil
+from bisect import bisect_right
+from operator import itemgetter
 from pathlib import Path
-from string import Template
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from string import Template
 
 from .config import DASHBOARD_CONFIG
 
+# Per-platform counters, in the order they are unpacked, and their defaults
+_GET_STATS = itemgetter('total', 'passed', 'failed', 'skipped', 'pass_rate', 'fail_rate', 'skip_rate')
+_STAT_DEFAULTS = {
+    'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0,
+    'pass_rate': 0.0, 'fail_rate': 0.0, 'skip_rate': 0.0,
+}
+
+# Pass-rate thresholds (percent) and the badge class for each band
+_RATE_THRESHOLDS = (50, 80)
+_RATE_CLASSES = ('danger', 'warning', 'success')
+
+
+def _rate_class(rate: float) -> str:
+    """Map a pass rate to its badge class."""
+    return _RATE_CLASSES[bisect_right(_RATE_THRESHOLDS, rate)]
+
+
+# HTML fragments for the index page, filled in with str.format_map
+_PLATFORM_CARD_TMPL = """
+                    <div class="platform-card">
+                        <div class="platform-header">
+                            <h3>{platform}</h3>
+                            <span class="badge badge-{platform_class}">{pass_rate:.1f}%</span>
+                        </div>
+                        <div class="platform-details">
+                            <div class="platform-stat">
+                                <span class="stat-label">Pass</span>
+                                <span class="stat-value stat-pass">{pass_rate:.1f}%</span>
+                                <span class="stat-count">({passed}/{total})</span>
+                            </div>
+                            <div class="platform-stat">
+                                <span class="stat-label">Fail</span>
+                                <span class="stat-value stat-fail">{fail_rate:.1f}%</span>
+                                <span class="stat-count">({failed}/{total})</span>
+                            </div>
+                            <div class="platform-stat">
+                                <span class="stat-label">Skip</span>
+                                <span class="stat-value stat-skip">{skip_rate:.1f}%</span>
+                                <span class="stat-count">({skipped}/{total})</span>
+                            </div>
+                        </div>
+                    </div>
+                """
+
+_RUN_PLATFORM_STATS_TMPL = """
+                        <div class="platform-stats">
+                            <span class="stat-pass">✓ {pass_rate:.1f}%</span>
+                            <span class="stat-fail">✗ {fail_rate:.1f}%</span>
+                            <span class="stat-skip">⊘ {skip_rate:.1f}%</span>
+                        </div>
+                        <div class="platform-counts">
+                            <small>({passed}/{total} pass, {failed} fail, {skipped} skip)</small>
+                        </div>
+                    """
+
+_RUN_ROW_TMPL = """
+                <tr>
+                    <td><code>{id}</code></td>
+                    <td>{branch}</td>
+                    <td><code>{commit_short}</code></td>
+                    <td><strong>{platform}</strong></td>
+                    <td>
+                        <span class="badge badge-{run_pass_class}">{run_pass_rate:.1f}%</span>
+                        {platform_breakdown}
+                    </td>
+                    <td>{created_at}</td>
+                    <td>
+                        <a href="data/runs/{id}.json">JSON</a>
+                    </td>
+                </tr>
+            """
+
+
+@functools.lru_cache(maxsize=32)
+def _load_template_cached(path_str: str, mtime_ns: int) -> "Template":
+    """Read and parse a template; keyed on mtime so edited files are re-read."""
+    from string import Template
+    
+    with open(path_str) as f:
+        return Template(f.read())
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, copying instead where linking fails (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _tree_is_current(src: Path, dst: Path) -> bool:
+    """Check that dst holds the same files as src, none older than their source."""
+    if not dst.is_dir():
+        return False
+    src_files = {p.relative_to(src): p for p in src.rglob('*') if p.is_file()}
+    dst_files = {p.relative_to(dst): p for p in dst.rglob('*') if p.is_file()}
+    if src_files.keys() != dst_files.keys():
+        return False
+    return all(
+        dst_files[rel].stat().st_mtime_ns >= path.stat().st_mtime_ns
+        for rel, path in src_files.items()
+    )
+
+
+def _find_artifact_html(root: Path):
+    """
+    Yield results.html files under root, skipping hidden directories.
+    
+    Walks directories depth-first in the same order as rglob, using the
+    type information scandir already has instead of stat-ing each entry.
+    """
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.'):
+                        subdirs.append(entry.path)
+                elif entry.name == "results.html":
+                    yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
 
 class DashboardGenerator:
     """Generate dashboard HTML from test results data."""
@@ -43,9 +173,11 @@ class DashboardGenerator:
         """Copy CSS/JS assets to site directory."""
         source_assets = DASHBOARD_CONFIG['assets_dir']
         if source_assets.exists():
+            if _tree_is_current(source_assets, self.assets_dir):
+                return
             if self.assets_dir.exists():
                 shutil.rmtree(self.assets_dir)
-            shutil.copytree(source_assets, self.assets_dir)
+            shutil.copytree(source_assets, self.assets_dir, copy_function=_link_or_copy)
             print(f"Copied assets to {self.assets_dir}")
     
     def _copy_artifact_html(self) -> List[str]:
@@ -53,16 +185,39 @@ class DashboardGenerator:
         if not self.artifacts_dir or not self.artifacts_dir.exists():
             return []
         
-        copied = []
-        for html_file in self.artifacts_dir.rglob("results.html"):
-            artifact_name = html_file.parent.name
-            dest = self.site_dir / f"{artifact_name}.html"
-            shutil.copy2(html_file, dest)
-            copied.append(artifact_name)
+        from concurrent.futures import ThreadPoolExecutor
+        
+        html_files = list(_find_artifact_html(self.artifacts_dir))
+        copied = [html_file.parent.name for html_file in html_files]
+        
+        # One source per destination, the last one found winning as it
+        # would when copying in order
+        sources = {self.site_dir / f"{name}.html": html_file
+                   for name, html_file in zip(copied, html_files)}
+        
+        def publish(dest: Path) -> None:
+            # Drop any previous link first so we never write through it
+            dest.unlink(missing_ok=True)
+            _link_or_copy(sources[dest], dest)
+        
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+            # Consume the results so a failed copy raises here
+            list(executor.map(publish, sources))
+        
+        for dest, html_file in sources.items():
             print(f"Copied {html_file} to {dest}")
         
         return copied
     
+    def _iter_runs(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield runs from index data, loading paginated runs one page at a time."""
+        if 'runs' in data:
+            yield from data['runs']
+            return
+        for page_name in data.get('pages', []):
+            with open(self.data_dir / page_name) as f:
+                yield from json.load(f)['runs']
+    
     def _generate_index(self, artifact_files: List[str]) -> None:
         """Generate main index.html."""
         # Load data
@@ -97,68 +252,41 @@ class DashboardGenerator:
             'overall_fail_rate': round(data.get('overall_fail_rate', 0), 2),
             'overall_skip_rate': round(data.get('overall_skip_rate', 0), 2),
             'implementations': ', '.join(data.get('implementations', [])),
-            'runs': data.get('runs', []),
+            'runs': self._iter_runs(data),
             'platform_stats': platform_stats,
         }
         
         # Determine pass rate class
-        pass_rate = context['overall_pass_rate']
-        if pass_rate >= 80:
-            context['pass_rate_class'] = 'success'
-        elif pass_rate >= 50:
-            context['pass_rate_class'] = 'warning'
-        else:
-            context['pass_rate_class'] = 'danger'
+        context['pass_rate_class'] = _rate_class(context['overall_pass_rate'])
         
         # Generate platform breakdown HTML
-        platform_breakdown_html = []
+        platform_breakdown_html = io.StringIO()
         if platform_stats:
+            sep = ''
             for platform, stats in sorted(platform_stats.items()):
-                total = stats.get('total', 0)
-                passed = stats.get('passed', 0)
-                failed = stats.get('failed', 0)
-                skipped = stats.get('skipped', 0)
-                pass_rate = stats.get('pass_rate', 0.0)
-                fail_rate = stats.get('fail_rate', 0.0)
-                skip_rate = stats.get('skip_rate', 0.0)
+                total, passed, failed, skipped, pass_rate, fail_rate, skip_rate = \
+                    _GET_STATS({**_STAT_DEFAULTS, **stats})
                 
                 # Determine pass rate class for this platform
-                if pass_rate >= 80:
-                    platform_class = 'success'
-                elif pass_rate >= 50:
-                    platform_class = 'warning'
-                else:
-                    platform_class = 'danger'
+                platform_class = _rate_class(pass_rate)
                 
-                platform_breakdown_html.append(f"""
-                    <div class="platform-card">
-                        <div class="platform-header">
-                            <h3>{platform}</h3>
-                            <span class="badge badge-{platform_class}">{pass_rate:.1f}%</span>
-                        </div>
-                        <div class="platform-details">
-                            <div class="platform-stat">
-                                <span class="stat-label">Pass</span>
-                                <span class="stat-value stat-pass">{pass_rate:.1f}%</span>
-                                <span class="stat-count">({passed}/{total})</span>
-                            </div>
-                            <div class="platform-stat">
-                                <span class="stat-label">Fail</span>
-                                <span class="stat-value stat-fail">{fail_rate:.1f}%</span>
-                                <span class="stat-count">({failed}/{total})</span>
-                            </div>
-                            <div class="platform-stat">
-                                <span class="stat-label">Skip</span>
-                                <span class="stat-value stat-skip">{skip_rate:.1f}%</span>
-                                <span class="stat-count">({skipped}/{total})</span>
-                            </div>
-                        </div>
-                    </div>
-                """)
+                platform_breakdown_html.write(sep)
+                sep = '\n'
+                platform_breakdown_html.write(_PLATFORM_CARD_TMPL.format_map({
+                    'platform': platform,
+                    'platform_class': platform_class,
+                    'pass_rate': pass_rate,
+                    'fail_rate': fail_rate,
+                    'skip_rate': skip_rate,
+                    'passed': passed,
+                    'failed': failed,
+                    'skipped': skipped,
+                    'total': total,
+                }))
         else:
-            platform_breakdown_html.append('<p class="text-muted">No platform data available</p>')
+            platform_breakdown_html.write('<p class="text-muted">No platform data available</p>')
         
-        context['platform_breakdown'] = '\n'.join(platform_breakdown_html) if platform_breakdown_html else ''
+        context['platform_breakdown'] = platform_breakdown_html.getvalue()
         
         # Generate implementation x platform matrix
         impl_platform_matrix = data.get('impl_platform_matrix', {})
@@ -179,44 +307,15 @@ class DashboardGenerator:
                 row_cells = [f'<td><strong>{impl_id}</strong></td>']
                 for platform in platforms:
                     cell_data = impl_platform_matrix.get(impl_id, {}).get(platform, {})
-                    passed = cell_data.get('passed', 0)
-                    failed = cell_data.get('failed', 0)
-                    skipped = cell_data.get('skipped', 0)
-                    total = cell_data.get('total', 0)
-                    pass_rate = cell_data.get('pass_rate', 0.0)
-                    fail_rate = cell_data.get('fail_rate', 0.0)
-                    skip_rate = cell_data.get('skip_rate', 0.0)
+                    total, passed, failed, skipped, pass_rate, fail_rate, skip_rate = \
+                        _GET_STATS({**_STAT_DEFAULTS, **cell_data})
                     
                     # Determine cell class based on pass rate
                     if total == 0:
                         cell_class = 'matrix-cell-empty'
                         cell_content = '<span class="text-muted">—</span>'
-                    elif pass_rate >= 80:
-                        cell_class = 'matrix-cell-success'
-                        cell_content = f'''
-                            <div class="matrix-cell-content">
-                                <div class="matrix-pass">✓ {pass_rate:.1f}%</div>
-                                <div class="matrix-details">
-                                    <small>{passed}/{total} pass</small>
-                                    {f'<small class="matrix-fail">, {failed} fail</small>' if failed > 0 else ''}
-                                    {f'<small class="matrix-skip">, {skipped} skip</small>' if skipped > 0 else ''}
-                                </div>
-                            </div>
-                        '''
-                    elif pass_rate >= 50:
-                        cell_class = 'matrix-cell-warning'
-                        cell_content = f'''
-                            <div class="matrix-cell-content">
-                                <div class="matrix-pass">✓ {pass_rate:.1f}%</div>
-                                <div class="matrix-details">
-                                    <small>{passed}/{total} pass</small>
-                                    {f'<small class="matrix-fail">, {failed} fail</small>' if failed > 0 else ''}
-                                    {f'<small class="matrix-skip">, {skipped} skip</small>' if skipped > 0 else ''}
-                                </div>
-                            </div>
-                        '''
                     else:
-                        cell_class = 'matrix-cell-danger'
+                        cell_class = f'matrix-cell-{_rate_class(pass_rate)}'
                         cell_content = f'''
                             <div class="matrix-cell-content">
                                 <div class="matrix-pass">✓ {pass_rate:.1f}%</div>
@@ -235,9 +334,10 @@ class DashboardGenerator:
         context['matrix_rows'] = '\n'.join(matrix_rows) if matrix_rows else '<tr><td colspan="100%">No data available</td></tr>'
         
         # Generate runs table rows
-        runs_rows = []
+        runs_rows = io.StringIO()
+        sep = ''
         for run in context['runs']:
-            run_pass_class = 'success' if run['pass_rate'] >= 80 else 'warning' if run['pass_rate'] >= 50 else 'danger'
+            run_pass_class = _rate_class(run['pass_rate'])
             commit_short = run['commit'][:7] if run['commit'] != 'unknown' else 'unknown'
             created_at = run['created_at'][:19] if len(run['created_at']) > 19 else run['created_at']
             
@@ -257,36 +357,31 @@ class DashboardGenerator:
             
             # Format platform breakdown
             if total > 0:
-                platform_breakdown = f"""
-                        <div class="platform-stats">
-                            <span class="stat-pass">✓ {pass_rate:.1f}%</span>
-                            <span class="stat-fail">✗ {fail_rate:.1f}%</span>
-                            <span class="stat-skip">⊘ {skip_rate:.1f}%</span>
-                        </div>
-                        <div class="platform-counts">
-                            <small>({passed}/{total} pass, {failed} fail, {skipped} skip)</small>
-                        </div>
-                    """
+                platform_breakdown = _RUN_PLATFORM_STATS_TMPL.format_map({
+                    'pass_rate': pass_rate,
+                    'fail_rate': fail_rate,
+                    'skip_rate': skip_rate,
+                    'passed': passed,
+                    'failed': failed,
+                    'skipped': skipped,
+                    'total': total,
+                })
             else:
                 platform_breakdown = '<span class="text-muted">No data</span>'
             
-            runs_rows.append(f"""
-                <tr>
-                    <td><code>{run['id']}</code></td>
-                    <td>{run['branch']}</td>
-                    <td><code>{commit_short}</code></td>
-                    <td><strong>{platform}</strong></td>
-                    <td>
-                        <span class="badge badge-{run_pass_class}">{run['pass_rate']:.1f}%</span>
-                        {platform_breakdown}
-                    </td>
-                    <td>{created_at}</td>
-                    <td>
-                        <a href="data/runs/{run['id']}.json">JSON</a>
-                    </td>
-                </tr>
-            """)
-        context['runs_rows'] = '\n'.join(runs_rows) if runs_rows else '<tr><td colspan="7">No runs available</td></tr>'
+            runs_rows.write(sep)
+            sep = '\n'
+            runs_rows.write(_RUN_ROW_TMPL.format_map({
+                'id': run['id'],
+                'branch': run['branch'],
+                'commit_short': commit_short,
+                'platform': platform,
+                'run_pass_class': run_pass_class,
+                'run_pass_rate': run['pass_rate'],
+                'platform_breakdown': platform_breakdown,
+                'created_at': created_at,
+            }))
+        context['runs_rows'] = runs_rows.getvalue() or '<tr><td colspan="7">No runs available</td></tr>'
         
         # Generate artifact HTML section
         if artifact_files:
@@ -306,7 +401,7 @@ class DashboardGenerator:
         # Render base template
         base_html = base_template.substitute(
             title=context['title'],
-            content=index_template.substitute(**context)
+            content=index_template.substitute(context)
         )
         
         # Write to site
@@ -314,11 +409,10 @@ class DashboardGenerator:
         output_file.write_text(base_html)
         print(f"Generated {output_file}")
     
-    def _load_template(self, name: str) -> Template:
+    def _load_template(self, name: str) -> "Template":
         """Load a template file."""
         template_file = self.template_dir / name
         if not template_file.exists():
             raise FileNotFoundError(f"Template not found: {template_file}")
-        with open(template_file) as f:
-            return Template(f.read())
+        return _load_template_cached(str(template_file), template_file.stat().st_mtime_ns)
 
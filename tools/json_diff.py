@@ -5,67 +5,172 @@ Structured diff tool for SWHID test results.
 Compares two result JSON files and emits structured diffs with JSON Pointer paths.
 """
 
-import json
 import sys
+from collections import Counter, deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class ResultDiff:
-    """Structured diff between two result objects."""
-    
-    def __init__(self):
-        self.diffs: List[Dict[str, Any]] = []
-    
-    def add_diff(self, path: str, expected: Any, actual: Any, category: str = "value_mismatch"):
-        """Add a diff entry."""
-        self.diffs.append({
-            "path": path,
-            "expected": expected,
-            "actual": actual,
-            "category": category
-        })
-    
-    def compare_values(self, path: str, expected: Any, actual: Any):
-        """Recursively compare two values and record differences."""
-        if expected == actual:
-            return
+from json import dumps as _json_dumps
+
+if ORJSON_AVAILABLE:
+    _dumps = orjson.dumps
+else:
+    _dumps = _json_dumps
+
+# Diff categories, shared by every diff entry
+_VALUE_MISMATCH = sys.intern("value_mismatch")
+_MISSING_FIELD = sys.intern("missing_field")
+_ORDERING = sys.intern("ordering")
+
+
+def _jkind(value: Any) -> int:
+    """Classify a value by JSON kind; ints and floats are both numbers, bools are not."""
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 2
+    if isinstance(value, str):
+        return 3
+    if isinstance(value, list):
+        return 4
+    if isinstance(value, dict):
+        return 5
+    return 6
+
+
+def _canonical(value: Any) -> Any:
+    """Return a hashable form of a JSON value: its serialization with sorted keys.
+
+    Serializing keeps True and 1 apart, and runs in C rather than
+    rebuilding the value as nested tuples.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return _json_dumps(value, sort_keys=True)
+
+
+def _same_json(expected: Any, actual: Any) -> bool:
+    """Check that two containers which compare equal also serialize alike.
+
+    Python's == treats True as 1 and False as 0; serializing keeps them
+    apart, and both steps run in C rather than walking the tree.
+    """
+    try:
+        return _dumps(expected) == _dumps(actual)
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_permutation(expected: List[Any], actual: List[Any]) -> bool:
+    """Check whether two lists of canonical forms hold the same values, in any order."""
+    return Counter(expected) == Counter(actual)
+
+
+@dataclass(slots=True)
+class DiffEntry:
+    """A single difference, located by its JSON Pointer path."""
+    path: str
+    expected: Any
+    actual: Any
+    category: str
+
+
+def _compare_iter(path: str, expected: Any, actual: Any) -> Iterator[DiffEntry]:
+    """Compare two values depth-first, yielding differences as they are found."""
+    # Worklist of (path, expected, actual, category); a category marks
+    # a diff that is already known and only waits its turn to be yielded,
+    # so diffs come out in the same order as a recursive walk
+    stack = deque([(path, expected, actual, None)])
+    while stack:
+        path, expected, actual, category = stack.pop()
+        if category is not None:
+            yield DiffEntry(path, expected, actual, category)
+            continue
+        
+        if expected is actual:
+            continue
         
-        if type(expected) != type(actual):
-            self.add_diff(path, expected, actual, "value_mismatch")
-            return
+        # Kinds are compared before values, since True == 1 in Python
+        kind = _jkind(expected)
+        if kind != _jkind(actual):
+            yield DiffEntry(path, expected, actual, _VALUE_MISMATCH)
+            continue
+        
+        # Equal containers are skipped whole unless a bool stands in for a
+        # number somewhere inside; only then (or when keys are merely in a
+        # different order) is the subtree walked
+        if kind >= 4 and expected == actual and _same_json(expected, actual):
+            continue
         
         if isinstance(expected, dict):
             # Compare dictionaries
-            all_keys = set(expected.keys()) | set(actual.keys())
-            for key in sorted(all_keys):
+            children = []
+            for key in sorted(expected.keys() | actual.keys()):
                 key_path = f"{path}/{key}" if path else f"/{key}"
                 if key not in expected:
-                    self.add_diff(key_path, None, actual[key], "missing_field")
+                    children.append((key_path, None, actual[key], _MISSING_FIELD))
                 elif key not in actual:
-                    self.add_diff(key_path, expected[key], None, "missing_field")
+                    children.append((key_path, expected[key], None, _MISSING_FIELD))
                 else:
-                    self.compare_values(key_path, expected[key], actual[key])
+                    children.append((key_path, expected[key], actual[key], None))
+            stack.extend(reversed(children))
         elif isinstance(expected, list):
             # Compare lists (check for ordering differences)
             if len(expected) != len(actual):
-                self.add_diff(path, len(expected), len(actual), "value_mismatch")
+                yield DiffEntry(path, len(expected), len(actual), _VALUE_MISMATCH)
+                continue
+            # Each element is serialized once per list, for both checks
+            canonical_expected = [_canonical(item) for item in expected]
+            canonical_actual = [_canonical(item) for item in actual]
+            if canonical_expected == canonical_actual:
+                continue
+            if _is_permutation(canonical_expected, canonical_actual):
+                # Same elements in different order
+                yield DiffEntry(path, expected, actual, _ORDERING)
             else:
-                # Check if same elements in different order
-                if sorted(expected) == sorted(actual) and expected != actual:
-                    self.add_diff(path, expected, actual, "ordering")
-                else:
-                    # Compare element by element
-                    for i, (exp_item, act_item) in enumerate(zip(expected, actual)):
-                        item_path = f"{path}/{i}"
-                        self.compare_values(item_path, exp_item, act_item)
-        else:
+                # Compare element by element
+                stack.extend(
+                    (f"{path}/{i}", expected[i], actual[i], None)
+                    for i in reversed(range(len(expected)))
+                )
+        elif expected != actual:
             # Primitive values
-            self.add_diff(path, expected, actual, "value_mismatch")
+            yield DiffEntry(path, expected, actual, _VALUE_MISMATCH)
+
+
+class ResultDiff:
+    """Structured diff between two result objects."""
+    
+    def __init__(self):
+        self.diffs: List[DiffEntry] = []
+    
+    def add_diff(self, path: str, expected: Any, actual: Any, category: str = _VALUE_MISMATCH):
+        """Add a diff entry."""
+        self.diffs.append(DiffEntry(path, expected, actual, category))
+    
+    def compare_values(self, path: str, expected: Any, actual: Any):
+        """Compare two values depth-first and record differences."""
+        self.diffs.extend(_compare_iter(path, expected, actual))
     
     def to_dict(self) -> List[Dict[str, Any]]:
         """Convert to dictionary format."""
-        return self.diffs
+        # Built by hand rather than with asdict(), which deep-copies values
+        return [
+            {"path": d.path, "expected": d.expected, "actual": d.actual, "category": d.category}
+            for d in self.diffs
+        ]
     
     def is_empty(self) -> bool:
         """Check if there are any differences."""
@@ -74,11 +179,17 @@ class ResultDiff:
 
 def diff_results(expected_file: str, actual_file: str) -> ResultDiff:
     """Compare two result JSON files."""
-    with open(expected_file, 'r') as f:
-        expected_data = json.load(f)
+    if ORJSON_AVAILABLE:
+        loads = orjson.loads
+    else:
+        import json
+        loads = json.loads
     
-    with open(actual_file, 'r') as f:
-        actual_data = json.load(f)
+    with open(expected_file, 'rb') as f:
+        expected_data = loads(f.read())
+    
+    with open(actual_file, 'rb') as f:
+        actual_data = loads(f.read())
     
     diff = ResultDiff()
     diff.compare_values("", expected_data, actual_data)
@@ -90,13 +201,15 @@ def format_diff(diff: ResultDiff, compact: bool = False) -> str:
     if diff.is_empty():
         return "✅ No differences found"
     
+    import json
+    
     lines = [f"Found {len(diff.diffs)} difference(s):\n"]
     
     for d in diff.diffs:
-        path = d["path"]
-        category = d["category"]
-        expected = d["expected"]
-        actual = d["actual"]
+        path = d.path
+        category = d.category
+        expected = d.expected
+        actual = d.actual
         
         if compact:
             lines.append(f"  {path}: {category}")
@@ -144,6 +257,8 @@ def main():
         diff = diff_results(args.expected, args.actual)
         
         if args.json:
+            import json
+            
             print(json.dumps(diff.to_dict(), indent=2))
         else:
             print(format_diff(diff, compact=args.compact))
@@ -4,47 +4,260 @@ Merge canonical results into dashboard layout.
 
 This script takes canonical results files and creates the proper dashboard structure:
 - site/data/runs/<run-id>.json (full canonical file)
-- site/data/index.json (roll-up with metadata)
+- site/data/index.json (roll-up with metadata and the list of run pages)
+- site/data/index-<page>.json (runs, newest first, in pages of --batch-size)
 - site/data/latest.json (compatibility)
 """
 
 import json
 import argparse
+import functools
+import hashlib
 import os
+import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 def load_canonical_results(file_path: str) -> Dict[str, Any]:
     """Load a canonical results file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+def dump_json(data: Any, pretty: bool = True) -> bytes:
+    """Serialize data as indented or minified JSON, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def write_bytes(file_path: Union[str, Path], payload: bytes) -> None:
+    """Replace file_path with payload, never writing through a hardlink."""
+    tmp_path = os.fspath(file_path) + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, file_path)
+
+def write_json(file_path: Path, data: Any) -> None:
+    """Write data as indented JSON."""
+    write_bytes(file_path, dump_json(data))
+
+def load_json_object(file_path: Path) -> Dict[str, Any]:
+    """Load a JSON object such as the hash manifest, or {} if missing or unreadable."""
+    try:
+        data = load_canonical_results(str(file_path))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def write_run_file(run_file: str, data: Any, known_hash: Optional[str],
+                   pretty: bool = False) -> Tuple[str, bool]:
+    """Write a run file unless its content hash matches the manifest.
+
+    Run files are minified unless pretty is set. Returns the content hash
+    and whether the file was written.
+    """
+    payload = dump_json(data, pretty)
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    if digest == known_hash and os.path.exists(run_file):
+        return digest, False
+    write_bytes(run_file, payload)
+    return digest, True
+
+def summarize_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a canonical results dict to what create_index_data needs."""
+    return {
+        "run": results["run"],
+        "implementations": results["implementations"],
+        "test_count": len(results["tests"]),
+        "status_counts": Counter(
+            (result["implementation"], result["status"])
+            for test in results["tests"]
+            for result in test["results"]
+        ),
+    }
+
+def load_results_summary(file_path: str) -> Dict[str, Any]:
+    """Summarize a canonical results file without keeping its tests in memory.
+
+    With ijson the tests are streamed one at a time; otherwise the whole
+    file is loaded and summarized.
+    """
+    if not IJSON_AVAILABLE:
+        return summarize_results(load_canonical_results(file_path))
+    
+    with open(file_path, 'rb') as f:
+        run = next(ijson.items(f, 'run', use_float=True))
+        f.seek(0)
+        implementations = next(ijson.items(f, 'implementations', use_float=True))
+        f.seek(0)
+        test_count = 0
+        status_counts = Counter()
+        for test in ijson.items(f, 'tests.item', use_float=True):
+            test_count += 1
+            status_counts.update(
+                (result["implementation"], result["status"]) for result in test["results"]
+            )
+    return {
+        "run": run,
+        "implementations": implementations,
+        "test_count": test_count,
+        "status_counts": status_counts,
+    }
+
+def file_sha256(file_path: str) -> str:
+    """Hash a file's contents without reading it into memory at once."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def summary_to_cache(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a results summary to a JSON-serializable summary cache entry."""
+    return {
+        "run": summary["run"],
+        "implementations": summary["implementations"],
+        "test_count": summary["test_count"],
+        "status_counts": [[impl_id, status, n] for (impl_id, status), n in summary["status_counts"].items()],
+    }
+
+def load_cached_summary(file_path: str, cache: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Summarize a results file, reusing the summary cache entry for its content hash.
 
+    Results files do not change once a run completes, so a cache hit
+    skips parsing the file altogether. Returns the hash and the summary.
+    """
+    digest = file_sha256(file_path)
+    entry = cache.get(digest)
+    if entry is not None:
+        try:
+            return digest, {
+                "run": entry["run"],
+                "implementations": entry["implementations"],
+                "test_count": entry["test_count"],
+                "status_counts": Counter({(impl_id, status): n for impl_id, status, n in entry["status_counts"]}),
+            }
+        except (KeyError, TypeError, ValueError):
+            pass
+    return digest, load_results_summary(file_path)
+
+def link_file(src: str, dst: Union[str, Path]) -> bool:
+    """Hardlink src to dst, replacing dst; return False if linking failed."""
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return True
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        return False
+    return True
+
+def link_or_copy(src: str, dst: Path) -> None:
+    """Hardlink src to dst, copying when linking is not possible."""
+    if not link_file(src, dst):
+        shutil.copy2(src, dst)
+
+# OS name fragments to platform names, in matching priority order: a
+# string mentioning several is resolved by the first fragment listed
+_PLATFORM_MAP = {
+    "ubuntu": "Ubuntu",
+    "linux": "Ubuntu",
+    "macos": "macOS",
+    "darwin": "macOS",
+    "windows": "Windows",
+}
+
+@functools.lru_cache(maxsize=32)
 def normalize_platform_name(os_string: str) -> str:
     """Normalize OS string to a friendly platform name."""
     os_lower = os_string.lower()
-    if "ubuntu" in os_lower or "linux" in os_lower:
-        return "Ubuntu"
-    elif "macos" in os_lower or "darwin" in os_lower:
-        return "macOS"
-    elif "windows" in os_lower:
-        return "Windows"
+    for fragment, platform in _PLATFORM_MAP.items():
+        if fragment in os_lower:
+            return platform
+    return os_string.split("-", 1)[0]
+
+def _add_rates(stats: Dict[str, Any]) -> None:
+    """Add pass/fail/skip percentages to a counts bucket in place."""
+    if stats["total"] > 0:
+        stats["pass_rate"] = round(stats["passed"] / stats["total"] * 100, 2)
+        stats["fail_rate"] = round(stats["failed"] / stats["total"] * 100, 2)
+        stats["skip_rate"] = round(stats["skipped"] / stats["total"] * 100, 2)
     else:
-        return os_string.split("-")[0] if "-" in os_string else os_string
+        stats["pass_rate"] = 0.0
+        stats["fail_rate"] = 0.0
+        stats["skip_rate"] = 0.0
+
+def run_has_failure(results: Dict[str, Any]) -> bool:
+    """Return True if any result is not a PASS, stopping at the first one."""
+    return any(
+        result["status"] != "PASS"
+        for test in results["tests"]
+        for result in test["results"]
+    )
+
+def create_failure_index(results_files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create a minimal index recording only whether each run has a non-PASS result."""
+    runs = []
+    for results in results_files:
+        runner_info = results.get("run", {}).get("runner", {})
+        runs.append({
+            "id": results["run"]["id"],
+            "created_at": results["run"]["created_at"],
+            "branch": results["run"]["branch"],
+            "commit": results["run"]["commit"],
+            "platform": normalize_platform_name(runner_info.get("os", "Unknown")),
+            "has_failure": run_has_failure(results),
+        })
+    runs.sort(key=itemgetter("created_at"), reverse=True)
+    
+    return {
+        "last_updated": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        "total_runs": len(runs),
+        "has_failure": any(run["has_failure"] for run in runs),
+        "runs": runs
+    }
 
 def create_index_data(results_files: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Create index.json data from multiple results files."""
+    return create_index_data_from_summaries([summarize_results(results) for results in results_files])
+
+def create_index_data_from_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create index.json data from results summaries (see summarize_results)."""
     runs = []
     total_tests = 0
+    total_results = 0
     total_passed = 0
     total_failed = 0
     total_skipped = 0
     implementations = set()
+    platform_stats = {}
+    # Matrix structure: {implementation_id: {platform: {passed, failed, skipped, total, pass_rate, fail_rate, skip_rate}}}
+    impl_platform_matrix = {}
     
-    for results in results_files:
+    for results in summaries:
         # Extract platform info
         runner_info = results.get("run", {}).get("runner", {})
         platform_name = normalize_platform_name(runner_info.get("os", "Unknown"))
+        run_impls = results["implementations"]
         
         run_data = {
             "id": results["run"]["id"],
@@ -59,22 +272,25 @@ def create_index_data(results_files: List[Dict[str, Any]]) -> Dict[str, Any]:
             "total": 0
         }
         
-        # Calculate pass/fail/skip counts
-        test_count = len(results["tests"])
-        passed_count = 0
-        failed_count = 0
-        skipped_count = 0
-        
-        for test in results["tests"]:
-            for result in test["results"]:
-                if result["status"] == "PASS":
-                    passed_count += 1
-                elif result["status"] == "FAIL":
-                    failed_count += 1
-                elif result["status"] == "SKIPPED":
-                    skipped_count += 1
+        # Split the status counts per implementation
+        test_count = results["test_count"]
+        counts = results["status_counts"]
+        passed_count = failed_count = skipped_count = 0
+        impl_counts = {}
+        for (impl_id, status), n in counts.items():
+            bucket = impl_counts.setdefault(impl_id, {"passed": 0, "failed": 0, "skipped": 0, "total": 0})
+            bucket["total"] += n
+            if status == "PASS":
+                passed_count += n
+                bucket["passed"] += n
+            elif status == "FAIL":
+                failed_count += n
+                bucket["failed"] += n
+            elif status == "SKIPPED":
+                skipped_count += n
+                bucket["skipped"] += n
         
-        total_result_count = test_count * len(results["implementations"])
+        total_result_count = test_count * len(run_impls)
         
         if total_result_count > 0:
             run_data["pass_rate"] = round(passed_count / total_result_count * 100, 2)
@@ -88,95 +304,44 @@ def create_index_data(results_files: List[Dict[str, Any]]) -> Dict[str, Any]:
         
         runs.append(run_data)
         total_tests += test_count
+        total_results += total_result_count
         total_passed += passed_count
         total_failed += failed_count
         total_skipped += skipped_count
         
-        # Collect implementations
-        for impl in results["implementations"]:
-            implementations.add(impl["id"])
+        # Accumulate per-platform totals
+        stats = platform_stats.setdefault(platform_name, {"total": 0, "passed": 0, "failed": 0, "skipped": 0})
+        stats["total"] += total_result_count
+        stats["passed"] += passed_count
+        stats["failed"] += failed_count
+        stats["skipped"] += skipped_count
+        
+        # Collect implementations and their per-platform counts
+        no_results = {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
+        for impl in run_impls:
+            impl_id = impl["id"]
+            implementations.add(impl_id)
+            cell = impl_platform_matrix.setdefault(impl_id, {}).setdefault(
+                platform_name, {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
+            )
+            for key, n in impl_counts.get(impl_id, no_results).items():
+                cell[key] += n
     
     # Sort runs by created_at (newest first)
-    runs.sort(key=lambda x: x["created_at"], reverse=True)
+    runs.sort(key=itemgetter("created_at"), reverse=True)
     
-    # Group runs by platform for aggregation
-    platform_stats = {}
-    for run in runs:
-        platform = run["platform"]
-        if platform not in platform_stats:
-            platform_stats[platform] = {
-                "total": 0,
-                "passed": 0,
-                "failed": 0,
-                "skipped": 0
-            }
-        platform_stats[platform]["total"] += run["total"]
-        platform_stats[platform]["passed"] += run["passed"]
-        platform_stats[platform]["failed"] += run["failed"]
-        platform_stats[platform]["skipped"] += run["skipped"]
-    
-    # Calculate per-platform rates
-    for platform, stats in platform_stats.items():
-        if stats["total"] > 0:
-            stats["pass_rate"] = round(stats["passed"] / stats["total"] * 100, 2)
-            stats["fail_rate"] = round(stats["failed"] / stats["total"] * 100, 2)
-            stats["skip_rate"] = round(stats["skipped"] / stats["total"] * 100, 2)
-        else:
-            stats["pass_rate"] = 0.0
-            stats["fail_rate"] = 0.0
-            stats["skip_rate"] = 0.0
+    # Calculate per-platform rates and the rates for each cell in the matrix
+    for stats in platform_stats.values():
+        _add_rates(stats)
+    for platforms in impl_platform_matrix.values():
+        for stats in platforms.values():
+            _add_rates(stats)
     
-    # Build implementation x platform matrix
-    # Matrix structure: {implementation_id: {platform: {passed, failed, skipped, total, pass_rate, fail_rate, skip_rate}}}
-    impl_platform_matrix = {}
-    for results in results_files:
-        runner_info = results.get("run", {}).get("runner", {})
-        platform_name = normalize_platform_name(runner_info.get("os", "Unknown"))
-        
-        # Count results per implementation for this platform
-        for impl in results["implementations"]:
-            impl_id = impl["id"]
-            if impl_id not in impl_platform_matrix:
-                impl_platform_matrix[impl_id] = {}
-            
-            if platform_name not in impl_platform_matrix[impl_id]:
-                impl_platform_matrix[impl_id][platform_name] = {
-                    "passed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                    "total": 0
-                }
-            
-            # Count results for this implementation
-            for test in results["tests"]:
-                for result in test["results"]:
-                    if result["implementation"] == impl_id:
-                        impl_platform_matrix[impl_id][platform_name]["total"] += 1
-                        if result["status"] == "PASS":
-                            impl_platform_matrix[impl_id][platform_name]["passed"] += 1
-                        elif result["status"] == "FAIL":
-                            impl_platform_matrix[impl_id][platform_name]["failed"] += 1
-                        elif result["status"] == "SKIPPED":
-                            impl_platform_matrix[impl_id][platform_name]["skipped"] += 1
-    
-    # Calculate rates for each cell in the matrix
-    for impl_id, platforms in impl_platform_matrix.items():
-        for platform, stats in platforms.items():
-            if stats["total"] > 0:
-                stats["pass_rate"] = round(stats["passed"] / stats["total"] * 100, 2)
-                stats["fail_rate"] = round(stats["failed"] / stats["total"] * 100, 2)
-                stats["skip_rate"] = round(stats["skipped"] / stats["total"] * 100, 2)
-            else:
-                stats["pass_rate"] = 0.0
-                stats["fail_rate"] = 0.0
-                stats["skip_rate"] = 0.0
-    
-    total_results = total_tests * len(implementations) if implementations else 0
     overall_fail_rate = round(total_failed / total_results * 100, 2) if total_results > 0 else 0
     overall_skip_rate = round(total_skipped / total_results * 100, 2) if total_results > 0 else 0
     
     return {
-        "last_updated": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "last_updated": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
         "total_runs": len(runs),
         "total_tests": total_tests,
         "total_results": total_results,
@@ -186,62 +351,171 @@ def create_index_data(results_files: List[Dict[str, Any]]) -> Dict[str, Any]:
         "overall_pass_rate": round(total_passed / total_results * 100, 2) if total_results > 0 else 0,
         "overall_fail_rate": overall_fail_rate,
         "overall_skip_rate": overall_skip_rate,
-        "implementations": sorted(list(implementations)),
+        "implementations": sorted(implementations),
         "platform_stats": platform_stats,
         "impl_platform_matrix": impl_platform_matrix,
         "runs": runs
     }
 
-def main():
+def paginate_index(index_data: Dict[str, Any], batch_size: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Split the runs of index data into pages of at most batch_size runs.
+
+    Returns the top-level index, which lists the page file names under
+    "pages" instead of holding the runs, and the page documents.
+    """
+    runs = index_data["runs"]
+    pages = [
+        {"page": i, "runs": runs[start:start + batch_size]}
+        for i, start in enumerate(range(0, len(runs), batch_size))
+    ]
+    top_level = {key: value for key, value in index_data.items() if key != "runs"}
+    top_level["pages"] = [f"index-{page['page']:03d}.json" for page in pages]
+    return top_level, pages
+
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description="Merge canonical results into dashboard layout")
     parser.add_argument("results_files", nargs="+", help="Canonical results JSON files")
     parser.add_argument("--site", default="site", help="Site directory")
+    parser.add_argument("--index-only", action="store_true",
+                        help="Stream results files to build the index and hardlink run files instead of rewriting them")
+    parser.add_argument("--hardlink", action="store_true",
+                        help="Hardlink run files to the results files instead of rewriting them")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent run files instead of writing them minified")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Only check whether every run passed, stopping at each run's first non-PASS result; "
+                             "exits non-zero on failure and writes nothing")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Maximum number of runs per index page (default: 500)")
+    parser.add_argument("--cache-dir",
+                        help="Directory, outside the site, for merge bookkeeping kept between runs "
+                             "(use one per site); without it every run file is rewritten and "
+                             "--index-only re-reads every results file")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
     
-    # Load all results files
-    results_files = []
+    # Load all results files; they are independent, so read them concurrently
+    existing_files = []
     for file_path in args.results_files:
         if os.path.exists(file_path):
-            results_files.append(load_canonical_results(file_path))
+            existing_files.append(file_path)
         else:
             print(f"Warning: File not found: {file_path}")
     
-    if not results_files:
-        print("Error: No valid results files found")
-        return 1
-    
-    # Create site directory structure
     site_dir = Path(args.site)
     data_dir = site_dir / "data"
     runs_dir = data_dir / "runs"
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    
+    results_files = None
+    summaries = []
+    summary_cache_file = cache_dir / "summary-cache.json" if cache_dir is not None else None
+    summary_cache = None
+    if existing_files:
+        with ThreadPoolExecutor(max_workers=min(32, len(existing_files))) as executor:
+            if args.index_only and not args.fail_fast and summary_cache_file is not None:
+                # Unchanged results files are summarized from the summary
+                # cache; the cache is rebuilt from this merge's inputs only
+                cached = list(executor.map(
+                    functools.partial(load_cached_summary, cache=load_json_object(summary_cache_file)),
+                    existing_files))
+                summaries = [summary for _, summary in cached]
+                summary_cache = {digest: summary_to_cache(summary) for digest, summary in cached}
+            elif args.index_only and not args.fail_fast:
+                summaries = list(executor.map(load_results_summary, existing_files))
+            else:
+                results_files = list(executor.map(load_canonical_results, existing_files))
+    
+    if not existing_files:
+        print("Error: No valid results files found")
+        return 1
     
+    # Only report whether every run passed, without writing the site
+    if args.fail_fast:
+        failure_index = create_failure_index(results_files)
+        for run in failure_index["runs"]:
+            print(f"{run['id']}: {'has failures' if run['has_failure'] else 'all tests passed'}")
+        return 1 if failure_index["has_failure"] else 0
+    
+    if results_files is not None:
+        summaries = [summarize_results(results) for results in results_files]
+    
+    # Create site directory structure
     data_dir.mkdir(parents=True, exist_ok=True)
     runs_dir.mkdir(parents=True, exist_ok=True)
     
-    # Write individual run files
-    for results in results_files:
-        run_id = results["run"]["id"]
-        run_file = runs_dir / f"{run_id}.json"
-        with open(run_file, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"Wrote {run_file}")
-    
-    # Create and write index.json
-    index_data = create_index_data(results_files)
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    if summary_cache is not None:
+        write_json(summary_cache_file, summary_cache)
+    
+    # Write individual run files; for a repeated run id the last results
+    # file wins, as it would when writing in order
+    manifest_file = cache_dir / "run-manifest.json" if cache_dir is not None else None
+    # Run file names are built by string concatenation, as there can be
+    # hundreds of them
+    runs_prefix = os.path.join(runs_dir, "")
+    manifest = load_json_object(manifest_file) if manifest_file is not None else {}
+    if results_files is None or args.hardlink:
+        # The run file is the results file itself, so link it rather than
+        # re-serializing; linked runs are not in the manifest. When linking
+        # fails (e.g. across filesystems) fall back to writing the loaded
+        # results, or copying the file when only its summary was loaded.
+        loaded = results_files if results_files is not None else [None] * len(summaries)
+        run_sources = {
+            summary['run']['id']: (file_path, results)
+            for summary, file_path, results in zip(summaries, existing_files, loaded)
+        }
+        for run_id, (file_path, results) in run_sources.items():
+            run_file = f"{runs_prefix}{run_id}.json"
+            if link_file(file_path, run_file):
+                manifest.pop(run_id, None)
+            elif results is None:
+                shutil.copy2(file_path, run_file)
+                manifest.pop(run_id, None)
+            else:
+                manifest[run_id], _ = write_run_file(run_file, results, None, pretty=args.pretty)
+            print(f"Wrote {run_file}")
+    else:
+        # Write concurrently, leaving files whose content hash matches
+        # the run manifest untouched
+        run_files = {results['run']['id']: results for results in results_files}
+        run_paths = [f"{runs_prefix}{run_id}.json" for run_id in run_files]
+        with ThreadPoolExecutor(max_workers=min(32, len(run_files))) as executor:
+            outcomes = list(executor.map(
+                functools.partial(write_run_file, pretty=args.pretty), run_paths, run_files.values(),
+                [manifest.get(run_id) for run_id in run_files]))
+        for run_id, run_file, (digest, written) in zip(run_files, run_paths, outcomes):
+            manifest[run_id] = digest
+            print(f"Wrote {run_file}" if written else f"Unchanged {run_file}")
+    if manifest_file is not None:
+        write_json(manifest_file, manifest)
+    
+    # Create and write index.json, with the runs split across index-NNN.json
+    # pages so the top-level file stays small as the run history grows
+    index_data, pages = paginate_index(create_index_data_from_summaries(summaries), args.batch_size)
+    for page_name, page in zip(index_data["pages"], pages):
+        page_file = data_dir / page_name
+        write_json(page_file, page)
+        print(f"Wrote {page_file}")
+    for stale_file in data_dir.glob("index-*.json"):
+        if stale_file.name not in index_data["pages"]:
+            stale_file.unlink()
     index_file = data_dir / "index.json"
-    with open(index_file, 'w') as f:
-        json.dump(index_data, f, indent=2)
+    write_json(index_file, index_data)
     print(f"Wrote {index_file}")
     
     # Write latest.json (compatibility)
-    if results_files:
-        latest_file = data_dir / "latest.json"
-        with open(latest_file, 'w') as f:
-            json.dump(results_files[0], f, indent=2)
-        print(f"Wrote {latest_file}")
+    latest_file = data_dir / "latest.json"
+    if results_files is None:
+        link_or_copy(existing_files[0], latest_file)
+    else:
+        write_json(latest_file, results_files[0])
+    print(f"Wrote {latest_file}")
     
-    print(f"Successfully merged {len(results_files)} results files")
+    print(f"Successfully merged {len(summaries)} results files")
     return 0
 
 if __name__ == "__main__":
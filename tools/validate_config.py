@@ -5,9 +5,43 @@ Validate that all payloads referenced in config.yaml actually exist.
 This script checks that every payload path in config.yaml points to an existing file or directory.
 """
 
+import os
 import sys
 import yaml
 from pathlib import Path
+from typing import Dict, Optional, Set
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+def list_existing_names(directory: str) -> Optional[Set[str]]:
+    """Return the names in directory that exist, or None if it can't be listed."""
+    try:
+        with os.scandir(directory or ".") as entries:
+            # A dangling symlink is listed but does not exist
+            return {
+                entry.name for entry in entries
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            }
+    except OSError:
+        return None
+
+def path_exists(path_str: str, listings: Dict[str, Optional[Set[str]]]) -> bool:
+    """Check a path against a cached listing of its parent directory.
+
+    Each parent directory is listed once. A name missing from the listing
+    is confirmed with Path.exists(), so results match checking every path
+    directly (e.g. on case-insensitive filesystems).
+    """
+    parent, name = os.path.split(path_str)
+    if parent not in listings:
+        listings[parent] = list_existing_names(parent)
+    names = listings[parent]
+    if names is not None and name in names:
+        return True
+    return Path(path_str).exists()
 
 def main():
     config_path = Path("config.yaml")
@@ -16,10 +50,11 @@ def main():
         sys.exit(1)
     
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     
     errors = []
     warnings = []
+    listings = {}
     
     for category, payloads in config.get("payloads", {}).items():
         for payload in payloads:
@@ -30,8 +65,7 @@ def main():
                 warnings.append(f"{category}/{name}: Missing path")
                 continue
             
-            path = Path(path_str)
-            if not path.exists():
+            if not path_exists(path_str, listings):
                 errors.append(f"{category}/{name}: Path does not exist: {path_str}")
     
     if errors: